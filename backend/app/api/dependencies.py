@@ -2,12 +2,14 @@ from fastapi import Depends, HTTPException
 import logging
 from app.services.models import ModelService
 from app.services.votes import VoteService
+from app.services.submissions import SubmissionQueue
 from app.core.formatting import LogFormatter
 
 logger = logging.getLogger(__name__)
 
 model_service = ModelService()
 vote_service = VoteService()
+submission_queue = SubmissionQueue()
 
 async def get_model_service() -> ModelService:
     """Dependency to get ModelService instance"""
@@ -31,4 +33,14 @@ async def get_vote_service() -> VoteService:
     except Exception as e:
         error_msg = "Failed to initialize vote service"
         logger.error(LogFormatter.error(error_msg, e))
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e)) 
+
+async def get_submission_queue() -> SubmissionQueue:
+    """Dependency to get SubmissionQueue instance"""
+    try:
+        await submission_queue.start()
+        return submission_queue
+    except Exception as e:
+        error_msg = "Failed to start submission queue"
+        logger.error(LogFormatter.error(error_msg, e))
+        raise HTTPException(status_code=500, detail=str(e))
@@ -2,7 +2,8 @@ from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import Dict, Any, List
 import logging
 from app.services.models import ModelService
-from app.api.dependencies import get_model_service
+from app.services.submissions import SubmissionQueue
+from app.api.dependencies import get_model_service, get_submission_queue
 from app.core.fastapi_cache import cached
 from app.core.formatting import LogFormatter
 
@@ -44,11 +45,12 @@ async def get_pending_models(
         logger.error(LogFormatter.error("Failed to get pending models", e))
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/submit")
+@router.post("/submit", status_code=202)
 async def submit_model(
     model_data: Dict[str, Any],
-    model_service: ModelService = Depends(get_model_service)
+    submission_queue: SubmissionQueue = Depends(get_submission_queue)
 ) -> Dict[str, Any]:
+    """Accept a model submission; validation and upload run in the background"""
     try:
         logger.info(LogFormatter.section("MODEL SUBMISSION"))
         
@@ -69,9 +71,13 @@ async def submit_model(
         for line in LogFormatter.tree(submission_info, "Submission Details"):
             logger.info(line)
             
-        result = await model_service.submit_model(model_data, user_id)
-        logger.info(LogFormatter.success("Model submitted successfully"))
-        return result
+        job = await submission_queue.submit(model_data, user_id)
+        logger.info(LogFormatter.success(f"Submission accepted as job {job['job_id']}"))
+        return {
+            "status": "accepted",
+            "message": "The submission was accepted and will be validated shortly",
+            "job_id": job["job_id"]
+        }
         
     except ValueError as e:
         logger.error(LogFormatter.error("Invalid submission data", e))
@@ -80,6 +86,51 @@ async def submit_model(
         logger.error(LogFormatter.error("Submission failed", e))
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/submit/batch", status_code=202)
+async def submit_models_batch(
+    batch_data: Dict[str, Any],
+    submission_queue: SubmissionQueue = Depends(get_submission_queue)
+) -> Dict[str, Any]:
+    """Accept several model submissions that are validated together and committed at once"""
+    try:
+        logger.info(LogFormatter.section("BATCH MODEL SUBMISSION"))
+        
+        user_id = batch_data.get("user_id")
+        if not user_id:
+            error_msg = "user_id is required"
+            logger.error(LogFormatter.error("Validation failed", error_msg))
+            raise ValueError(error_msg)
+        
+        models_data = batch_data.get("models")
+        if not isinstance(models_data, list):
+            raise ValueError("models must be a list of submissions")
+        
+        job = await submission_queue.submit_batch(models_data, user_id)
+        logger.info(LogFormatter.success(f"Batch of {len(models_data)} models accepted as job {job['job_id']}"))
+        return {
+            "status": "accepted",
+            "message": f"The batch of {len(models_data)} models was accepted and will be validated shortly",
+            "job_id": job["job_id"]
+        }
+        
+    except ValueError as e:
+        logger.error(LogFormatter.error("Invalid batch submission data", e))
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(LogFormatter.error("Batch submission failed", e))
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/submissions/{job_id}")
+async def get_submission_status(
+    job_id: str,
+    submission_queue: SubmissionQueue = Depends(get_submission_queue)
+) -> Dict[str, Any]:
+    """Get progress of an asynchronous submission"""
+    job = submission_queue.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Submission job {job_id} not found")
+    return job
+
 @router.get("/organization/{organization}/submissions")
 async def get_organization_submissions(
     organization: str,
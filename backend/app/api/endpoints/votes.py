@@ -1,5 +1,5 @@
 from fastapi import APIRouter, HTTPException, Query, Depends, Response
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from app.services.votes import VoteService
 from app.core.fastapi_cache import cached, build_cache_key, invalidate_cache_key
 import logging
@@ -16,7 +16,8 @@ def model_votes_key_builder(func, namespace: str = "model_votes", **kwargs):
     """Build cache key for model votes"""
     provider = kwargs.get('provider')
     model = kwargs.get('model')
-    key = build_cache_key(namespace, provider, model)
+    variant = None if kwargs.get('include_votes', True) else "summary"
+    key = build_cache_key(namespace, provider, model, variant)
     logger.debug(LogFormatter.info(f"Built model votes cache key: {key}"))
     return key
 
@@ -27,6 +28,49 @@ def user_votes_key_builder(func, namespace: str = "user_votes", **kwargs):
     logger.debug(LogFormatter.info(f"Built user votes cache key: {key}"))
     return key
 
+def trending_key_builder(func, namespace: str = "trending_votes", **kwargs):
+    """Build cache key for trending models"""
+    key = build_cache_key(namespace, kwargs.get('window'), kwargs.get('limit'))
+    logger.debug(LogFormatter.info(f"Built trending cache key: {key}"))
+    return key
+
+@router.get("/trending")
+@cached(expire=CACHE_TTL, key_builder=trending_key_builder)
+async def get_trending_models(
+    response: Response,
+    window: str = Query("24h", description="Time window, e.g. 24h or 7d"),
+    limit: int = Query(10, ge=1, le=100, description="Number of models to return")
+) -> List[Dict[str, Any]]:
+    """Get the most up voted models over a recent window"""
+    try:
+        await vote_service.initialize()
+        trending = await vote_service.get_trending_models(window=window, limit=limit)
+        response.headers["Cache-Control"] = f"max-age={CACHE_TTL}"
+        return trending
+    except Exception as e:
+        logger.error(LogFormatter.error("Failed to get trending models", e))
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/summary")
+async def get_votes_summary(
+    response: Response,
+    summary_request: Dict[str, Any]
+) -> Dict[str, Dict[str, Any]]:
+    """Get vote totals for several models, and whether a user voted on each"""
+    try:
+        model_ids = summary_request.get("model_ids")
+        if not isinstance(model_ids, list) or not all(isinstance(model_id, str) for model_id in model_ids):
+            raise ValueError("model_ids must be a list of model ids")
+        user_id = summary_request.get("user_id")
+        
+        await vote_service.initialize()
+        summary = await vote_service.get_votes_summary(model_ids, user_id)
+        response.headers["Cache-Control"] = "no-cache"
+        return summary
+    except Exception as e:
+        logger.error(LogFormatter.error("Failed to get votes summary", e))
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/{model_id:path}")
 async def add_vote(
     response: Response,
@@ -56,9 +100,11 @@ async def add_vote(
             
             # Build and invalidate cache keys
             model_cache_key = build_cache_key("model_votes", provider, model)
+            model_summary_cache_key = build_cache_key("model_votes", provider, model, "summary")
             user_cache_key = build_cache_key("user_votes", user_id)
             
             await invalidate_cache_key(model_cache_key)
+            await invalidate_cache_key(model_summary_cache_key)
             await invalidate_cache_key(user_cache_key)
             
             cache_stats = {
@@ -84,14 +130,15 @@ async def add_vote(
 async def get_model_votes(
     response: Response,
     provider: str, 
-    model: str
+    model: str,
+    include_votes: bool = Query(True, description="Include the raw list of votes")
 ) -> Dict[str, Any]:
     """Get all votes for a specific model"""
     try:
         logger.info(LogFormatter.info(f"Fetching votes for model: {provider}/{model}"))
         await vote_service.initialize()
         model_id = f"{provider}/{model}"
-        result = await vote_service.get_model_votes(model_id)
+        result = await vote_service.get_model_votes(model_id, include_votes=include_votes)
         
         # Add cache control headers
         response.headers["Cache-Control"] = f"max-age={CACHE_TTL}"
@@ -123,4 +170,47 @@ async def get_user_votes(
         return votes
     except Exception as e:
         logger.error(LogFormatter.error("Failed to get user votes", e))
-        raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e)) 
+
+@router.get("/model/{provider}/{model}/history")
+async def get_model_votes_history(
+    response: Response,
+    provider: str,
+    model: str,
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of votes to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    since: Optional[str] = Query(None, description="Only votes at or after this ISO timestamp"),
+    until: Optional[str] = Query(None, description="Only votes before this ISO timestamp")
+) -> Dict[str, Any]:
+    """Get a page of votes for a specific model, newest first"""
+    try:
+        await vote_service.initialize()
+        result = await vote_service.get_model_votes_page(
+            f"{provider}/{model}", limit=limit, cursor=cursor, since=since, until=until
+        )
+        response.headers["Cache-Control"] = "no-cache"
+        return result
+    except Exception as e:
+        logger.error(LogFormatter.error("Failed to get model votes history", e))
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/user/{user_id}/history")
+async def get_user_votes_history(
+    response: Response,
+    user_id: str,
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of votes to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    since: Optional[str] = Query(None, description="Only votes at or after this ISO timestamp"),
+    until: Optional[str] = Query(None, description="Only votes before this ISO timestamp")
+) -> Dict[str, Any]:
+    """Get a page of votes from a specific user, newest first"""
+    try:
+        await vote_service.initialize()
+        result = await vote_service.get_user_votes_page(
+            user_id, limit=limit, cursor=cursor, since=since, until=until
+        )
+        response.headers["Cache-Control"] = "no-cache"
+        return result
+    except Exception as e:
+        logger.error(LogFormatter.error("Failed to get user votes history", e))
+        raise HTTPException(status_code=400, detail=str(e))
@@ -14,6 +14,7 @@ from app.api.router import router
 from app.core.fastapi_cache import setup_cache
 from app.core.formatting import LogFormatter
 from app.config import hf_config
+from app.api.dependencies import submission_queue, vote_service
 
 # Configure logging before anything else
 LOGGING_CONFIG = {
@@ -103,4 +104,15 @@ async def startup_event():
     
     # Setup cache
     setup_cache()
-    logger.info(LogFormatter.success("FastAPI Cache initialized with in-memory backend")) 
\ No newline at end of file
+    logger.info(LogFormatter.success("FastAPI Cache initialized with in-memory backend"))
+    
+    # Resume submissions interrupted by a restart
+    await submission_queue.start()
+    
+    # Load votes in the background so requests only ever read memory
+    vote_service.start_initialization()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Flush pending work before the worker exits"""
+    await vote_service.close()
@@ -18,6 +18,15 @@ RATE_LIMIT_PERIOD = 7  # days
 RATE_LIMIT_QUOTA = 5
 HAS_HIGHER_RATE_LIMIT = []
 
+# Submission queue
+SUBMISSION_WORKERS = int(os.environ.get("SUBMISSION_WORKERS", 2))
+SUBMISSION_JOB_RETENTION_DAYS = 7
+
+# Model validation: strict mode instantiates the config and tokenizer instead of checking their metadata
+STRICT_MODEL_VALIDATION = os.environ.get("STRICT_MODEL_VALIDATION", "false").lower() == "true"
+# Optional local directory of <org>/<model>/<revision> weights used for sizing instead of the hub
+SAFETENSORS_MIRROR_DIR = Path(os.environ["SAFETENSORS_MIRROR_DIR"]) if os.environ.get("SAFETENSORS_MIRROR_DIR") else None
+
 # HuggingFace configuration
 HF_TOKEN = os.environ.get("HF_TOKEN")
 HF_ORGANIZATION = "open-llm-leaderboard"
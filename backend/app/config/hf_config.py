@@ -24,6 +24,10 @@ AGGREGATED_REPO = f"{HF_ORGANIZATION}/contents"
 VOTES_REPO = f"{HF_ORGANIZATION}/votes"
 OFFICIAL_PROVIDERS_REPO = f"{HF_ORGANIZATION}/official-providers"
 
+# Votes dataset layout: a legacy base file plus append-only shards
+VOTES_BASE_FILE = "votes_data.jsonl"
+VOTES_SHARDS_DIR = "shards"
+
 # File paths from cache config
 VOTES_PATH = cache_config.votes_file
 EVAL_REQUESTS_PATH = cache_config.eval_requests_file
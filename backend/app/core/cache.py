@@ -26,7 +26,12 @@ class CacheConfig:
         
         # Specific files
         self.votes_file = self.votes_cache / "votes_data.jsonl"
+        self.votes_state_file = self.votes_cache / "votes_state.json"
+        self.votes_pending_file = self.votes_cache / "votes_pending.jsonl"
         self.eval_requests_file = self.eval_cache / "eval_requests.jsonl"
+        self.queue_manifest_file = self.eval_cache / "queue_manifest.json"
+        self.submission_jobs_file = self.eval_cache / "submission_jobs.jsonl"
+        self.model_sizes_file = self.models_cache / "model_sizes.json"
         
         # Cache TTL
         self.cache_ttl = timedelta(seconds=CACHE_TTL)
@@ -61,7 +66,9 @@ class CacheConfig:
 
         env_vars = {
             "HF_HOME": str(self.cache_root),
-            "HF_DATASETS_CACHE": str(self.datasets_cache)
+            "HF_DATASETS_CACHE": str(self.datasets_cache),
+            # Read by datasets when it is first imported
+            "HF_DATASETS_DISABLE_PROGRESS_BARS": "1"
         }
 
         for var, value in env_vars.items():
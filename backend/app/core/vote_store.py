@@ -0,0 +1,288 @@
+import bisect
+import heapq
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+# Votes are stored with second precision, in the format used on the hub
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Width of the per-model vote count buckets used for trending
+BUCKET_SECONDS = 3600
+
+class StringTable:
+    """Interns strings as small integer ids"""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._values: List[str] = []
+
+    def intern(self, value: str) -> int:
+        """Get the id of a string, assigning a new one if needed"""
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = len(self._values)
+            self._ids[value] = string_id
+            self._values.append(value)
+        return string_id
+
+    def get_id(self, value: str) -> Optional[int]:
+        """Get the id of a string without interning it"""
+        return self._ids.get(value)
+
+    def __getitem__(self, string_id: int) -> str:
+        return self._values[string_id]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def clear(self):
+        self._ids.clear()
+        self._values.clear()
+
+class VoteStore:
+    """Columnar in-memory vote storage
+
+    Each vote is a row across typed arrays of interned string ids, so the
+    model, user, revision and precision strings are held once no matter how
+    many votes reference them. Per-model and per-user indexes are arrays of
+    row offsets kept in (timestamp, row) order, and duplicate detection uses
+    a set of packed integer keys. Up vote counts per model are also kept in
+    hourly buckets for trending queries.
+    """
+
+    def __init__(self):
+        self._models = StringTable()
+        self._users = StringTable()
+        self._values = StringTable()  # revisions, precisions and vote types
+
+        self._model = array('I')
+        self._user = array('I')
+        self._revision = array('I')
+        self._precision = array('I')
+        self._vote_type = array('I')
+        self._timestamp = array('q')  # seconds since epoch
+
+        self._rows_by_model: Dict[int, array] = {}
+        self._rows_by_user: Dict[int, array] = {}
+        self._keys: Set[int] = set()
+        self._buckets: Dict[int, Dict[int, int]] = {}  # bucket -> model id -> up votes
+        self._latest_timestamp: Optional[int] = None
+
+    @staticmethod
+    def _pack_key(model_id: int, revision_id: int, user_id: int, precision_id: int) -> int:
+        """Pack the ids of a (model, revision, user, precision) tuple into one integer"""
+        return (model_id << 96) | (revision_id << 64) | (user_id << 32) | precision_id
+
+    @staticmethod
+    def parse_timestamp(timestamp: str) -> int:
+        """Convert an ISO timestamp to seconds since epoch"""
+        parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return int(parsed.timestamp())
+
+    def contains(self, model: str, revision: str, user: str, precision: str) -> bool:
+        """Check whether a vote with this configuration exists"""
+        ids = (
+            self._models.get_id(model),
+            self._values.get_id(revision),
+            self._users.get_id(user),
+            self._values.get_id(precision)
+        )
+        if None in ids:
+            return False
+        return self._pack_key(*ids) in self._keys
+
+    def add(self, vote: Dict[str, Any]) -> bool:
+        """Add a vote, returning False if the same configuration was already voted
+
+        Raises:
+            KeyError: If the vote has no model, username or timestamp
+        """
+        model_id = self._models.intern(vote["model"])
+        user_id = self._users.intern(vote["username"])
+        revision_id = self._values.intern(vote.get("revision", "main"))
+        precision_id = self._values.intern(vote.get("precision", "unknown"))
+
+        key = self._pack_key(model_id, revision_id, user_id, precision_id)
+        if key in self._keys:
+            return False
+        timestamp = self.parse_timestamp(vote["timestamp"])
+        self._keys.add(key)
+
+        row = len(self._model)
+        self._model.append(model_id)
+        self._user.append(user_id)
+        self._revision.append(revision_id)
+        self._precision.append(precision_id)
+        self._vote_type.append(self._values.intern(vote.get("vote_type", "unknown")))
+        self._timestamp.append(timestamp)
+        if self._latest_timestamp is None or timestamp > self._latest_timestamp:
+            self._latest_timestamp = timestamp
+
+        if model_id not in self._rows_by_model:
+            self._rows_by_model[model_id] = array('I')
+        self._insert_row(self._rows_by_model[model_id], row)
+
+        if user_id not in self._rows_by_user:
+            self._rows_by_user[user_id] = array('I')
+        self._insert_row(self._rows_by_user[user_id], row)
+
+        if vote.get("vote_type") == "up":
+            bucket = self._buckets.setdefault(timestamp // BUCKET_SECONDS, {})
+            bucket[model_id] = bucket.get(model_id, 0) + 1
+
+        return True
+
+    def _row_key(self, row: int) -> Tuple[int, int]:
+        """Sort key of a row in the indexes"""
+        return self._timestamp[row], row
+
+    def _insert_row(self, rows: array, row: int):
+        """Insert a row offset into an index, keeping it in timestamp order"""
+        key = self._row_key(row)
+        if not rows or self._row_key(rows[-1]) <= key:
+            rows.append(row)
+        else:
+            rows.insert(bisect.bisect_right(rows, key, key=self._row_key), row)
+
+    def _page(
+        self,
+        rows: array,
+        limit: int,
+        cursor: Optional[str],
+        since: Optional[int],
+        until: Optional[int]
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get the newest votes of an index, older than cursor and within [since, until)"""
+        lo = 0
+        hi = len(rows)
+        if since is not None:
+            lo = bisect.bisect_left(rows, (since, -1), key=self._row_key)
+        if until is not None:
+            hi = bisect.bisect_left(rows, (until, -1), key=self._row_key)
+        if cursor is not None:
+            hi = min(hi, bisect.bisect_left(rows, self.decode_cursor(cursor), key=self._row_key))
+
+        start = max(lo, hi - limit)
+        votes = [self.row(row) for row in reversed(rows[start:hi])]
+        next_cursor = self.encode_cursor(self._row_key(rows[start])) if start > lo else None
+        return votes, next_cursor
+
+    @staticmethod
+    def encode_cursor(key: Tuple[int, int]) -> str:
+        """Encode a (timestamp, row) position as an opaque cursor"""
+        return f"{key[0]}.{key[1]}"
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[int, int]:
+        """Decode a cursor produced by encode_cursor
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        timestamp, row = cursor.split(".")
+        return int(timestamp), int(row)
+
+    def row(self, row: int) -> Dict[str, Any]:
+        """Materialize a stored vote as a dict"""
+        return {
+            "model": self._models[self._model[row]],
+            "revision": self._values[self._revision[row]],
+            "username": self._users[self._user[row]],
+            "timestamp": datetime.fromtimestamp(self._timestamp[row], tz=timezone.utc).strftime(TIMESTAMP_FORMAT),
+            "vote_type": self._values[self._vote_type[row]],
+            "precision": self._values[self._precision[row]]
+        }
+
+    def votes_for_model(self, model: str) -> List[Dict[str, Any]]:
+        """Get all votes of a model"""
+        model_id = self._models.get_id(model)
+        if model_id is None:
+            return []
+        return [self.row(row) for row in self._rows_by_model.get(model_id, ())]
+
+    def votes_for_user(self, user: str) -> List[Dict[str, Any]]:
+        """Get all votes of a user"""
+        user_id = self._users.get_id(user)
+        if user_id is None:
+            return []
+        return [self.row(row) for row in self._rows_by_user.get(user_id, ())]
+
+    def models_voted_by(self, user: str) -> Set[str]:
+        """Get the models a user has voted on"""
+        user_id = self._users.get_id(user)
+        if user_id is None:
+            return set()
+        return {self._models[self._model[row]] for row in self._rows_by_user.get(user_id, ())}
+
+    def model_votes_page(
+        self,
+        model: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get a page of a model's votes, newest first, with the cursor of the next page"""
+        model_id = self._models.get_id(model)
+        rows = self._rows_by_model.get(model_id) if model_id is not None else None
+        if rows is None:
+            return [], None
+        return self._page(rows, limit, cursor, since, until)
+
+    def user_votes_page(
+        self,
+        user: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get a page of a user's votes, newest first, with the cursor of the next page"""
+        user_id = self._users.get_id(user)
+        rows = self._rows_by_user.get(user_id) if user_id is not None else None
+        if rows is None:
+            return [], None
+        return self._page(rows, limit, cursor, since, until)
+
+    def top_models(self, since: int, until: int, limit: int) -> List[Tuple[str, int]]:
+        """Get the models with the most up votes in the buckets covering [since, until)"""
+        counts: Dict[int, int] = {}
+        for bucket_id in range(since // BUCKET_SECONDS, (until - 1) // BUCKET_SECONDS + 1):
+            for model_id, count in self._buckets.get(bucket_id, {}).items():
+                counts[model_id] = counts.get(model_id, 0) + count
+
+        top = heapq.nlargest(limit, counts.items(), key=lambda item: item[1])
+        return [(self._models[model_id], count) for model_id, count in top]
+
+    @property
+    def latest_timestamp(self) -> Optional[datetime]:
+        """Timestamp of the most recent vote"""
+        if self._latest_timestamp is None:
+            return None
+        return datetime.fromtimestamp(self._latest_timestamp, tz=timezone.utc)
+
+    @property
+    def model_count(self) -> int:
+        return len(self._rows_by_model)
+
+    @property
+    def user_count(self) -> int:
+        return len(self._rows_by_user)
+
+    def __len__(self) -> int:
+        return len(self._model)
+
+    def clear(self):
+        """Remove all votes"""
+        for table in (self._models, self._users, self._values):
+            table.clear()
+        for column in (self._model, self._user, self._revision, self._precision, self._vote_type, self._timestamp):
+            del column[:]
+        self._rows_by_model.clear()
+        self._rows_by_user.clear()
+        self._keys.clear()
+        self._buckets.clear()
+        self._latest_timestamp = None
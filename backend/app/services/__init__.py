@@ -1,3 +1,3 @@
-from . import hf_service, leaderboard, votes, models
+from . import hf_service, leaderboard, votes, models, submissions
 
-__all__ = ["hf_service", "leaderboard", "votes", "models"]
+__all__ = ["hf_service", "leaderboard", "votes", "models", "submissions"]
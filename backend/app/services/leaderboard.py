@@ -1,17 +1,17 @@
 from app.core.cache import cache_config
 from datetime import datetime
-from typing import List, Dict, Any
-import datasets
+from typing import List, Dict, Any, FrozenSet
 from fastapi import HTTPException
 import logging
 from app.config.base import HF_ORGANIZATION
 from app.core.formatting import LogFormatter
+from app.utils.model_validation import ModelValidator
 
 logger = logging.getLogger(__name__)
 
 class LeaderboardService:
     def __init__(self):
-        pass
+        self.validator = ModelValidator()
         
     async def fetch_raw_data(self) -> List[Dict[str, Any]]:
         """Fetch raw leaderboard data from HuggingFace dataset"""
@@ -20,6 +20,8 @@ class LeaderboardService:
             logger.info(LogFormatter.info(f"Loading dataset from {HF_ORGANIZATION}/contents"))
             
             try:
+                # Imported on first use, as datasets is slow to import
+                import datasets
                 dataset = datasets.load_dataset(
                     f"{HF_ORGANIZATION}/contents",
                     cache_dir=cache_config.get_cache_path("datasets")
@@ -56,6 +58,11 @@ class LeaderboardService:
             logger.info(LogFormatter.section("FORMATTING LEADERBOARD DATA"))
             
             raw_data = await self.fetch_raw_data()
+            try:
+                official_providers = await self.validator.get_official_providers()
+            except Exception as e:
+                logger.warning(LogFormatter.warning(f"Official providers unavailable, using dataset flags: {str(e)}"))
+                official_providers = frozenset()
             formatted_data = []
             type_counts = {}
             error_count = 0
@@ -66,7 +73,7 @@ class LeaderboardService:
             
             for i, item in enumerate(raw_data, 1):
                 try:
-                    formatted_item = await self.transform_data(item)
+                    formatted_item = await self.transform_data(item, official_providers)
                     formatted_data.append(formatted_item)
                     
                     # Count model types
@@ -105,7 +112,11 @@ class LeaderboardService:
             logger.error(LogFormatter.error("Failed to format leaderboard data", e))
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def transform_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def transform_data(
+        self,
+        data: Dict[str, Any],
+        official_providers: FrozenSet[str] = frozenset()
+    ) -> Dict[str, Any]:
         """Transform raw data into the format expected by the frontend"""
         try:
             # Extract model name for logging
@@ -154,6 +165,7 @@ class LeaderboardService:
                 "is_moe": data.get("MoE", False),
                 "is_flagged": data.get("Flagged", False),
                 "is_official_provider": data.get("Official Providers", False)
+                    or model_name.split("/")[0] in official_providers
             }
 
             metadata = {
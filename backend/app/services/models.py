@@ -1,5 +1,5 @@
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Set, Tuple
 import json
 import os
 from pathlib import Path
@@ -8,10 +8,8 @@ import aiohttp
 import asyncio
 import time
 from huggingface_hub import HfApi, CommitOperationAdd
-from huggingface_hub.utils import build_hf_headers
-from datasets import disable_progress_bar
+from huggingface_hub.utils import build_hf_headers, disable_progress_bars
 import sys
-import contextlib
 from concurrent.futures import ThreadPoolExecutor
 import tempfile
 
@@ -27,25 +25,23 @@ from app.services.votes import VoteService
 from app.core.cache import cache_config
 from app.core.formatting import LogFormatter
 
-# Disable datasets progress bars globally
-disable_progress_bar()
-
 logger = logging.getLogger(__name__)
 
-# Context manager to temporarily disable stdout and stderr
-@contextlib.contextmanager
-def suppress_output():
-    stdout = sys.stdout
-    stderr = sys.stderr
-    devnull = open(os.devnull, 'w')
-    try:
-        sys.stdout = devnull
-        sys.stderr = devnull
-        yield
-    finally:
-        sys.stdout = stdout
-        sys.stderr = stderr
-        devnull.close()
+# Queue manifest format
+MANIFEST_VERSION = 1
+MANIFEST_COLUMNS = ("name", "submitter", "revision", "submission_time", "status", "precision")
+
+# Fields every submission must provide
+REQUIRED_SUBMISSION_FIELDS = [
+    "model_id", "base_model", "revision", "precision",
+    "weight_type", "model_type", "use_chat_template"
+]
+
+# Maximum number of models of a batch validated at the same time
+BATCH_VALIDATION_CONCURRENCY = 4
+
+# Snapshot downloads run in worker threads, keep their progress bars off the console
+disable_progress_bars()
 
 class ProgressTracker:
     def __init__(self, total: int, desc: str = "Progress", update_frequency: int = 10):
@@ -123,8 +119,14 @@ class ModelService(HuggingFaceService):
             
             self.eval_requests_path.parent.mkdir(parents=True, exist_ok=True)
             self.hf_api = HfApi(token=HF_TOKEN)
+            self.queue_manifest_path = cache_config.queue_manifest_file
             self.cached_models = None
             self.last_cache_update = 0
+            self._submission_index: Dict[Tuple[str, str], str] = {}  # (name, revision) -> status
+            self._finished_model_names: Set[str] = set()
+            self._queue_revision: Optional[str] = None
+            self._reconcile_task: Optional[asyncio.Task] = None
+            self._refresh_task: Optional[asyncio.Task] = None
             self.cache_ttl = cache_config.cache_ttl.total_seconds()
             self._init_done = True
             logger.info(LogFormatter.success("Initialization complete"))
@@ -203,7 +205,14 @@ class ModelService(HuggingFaceService):
             return None
 
     async def _refresh_models_cache(self):
-        """Refresh the models cache"""
+        """Refresh the models cache, concurrent callers share the refresh in flight"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._load_models_cache())
+        # A cancelled caller must not cancel the refresh the others wait on
+        return await asyncio.shield(self._refresh_task)
+
+    async def _load_models_cache(self):
+        """Load the models cache from a snapshot of the requests repository"""
         try:
             logger.info(LogFormatter.section("CACHE REFRESH"))
             self._log_repo_operation("read", f"{HF_ORGANIZATION}/requests", "Refreshing models cache")
@@ -219,13 +228,17 @@ class ModelService(HuggingFaceService):
                 logger.info(LogFormatter.subsection("DATASET LOADING"))
                 logger.info(LogFormatter.info("Loading dataset..."))
                 
+                # Pin the snapshot to the current revision so the manifest matches it
+                revision = await self._get_queue_revision()
+                
                 # Download entire dataset snapshot
-                with suppress_output():
-                    local_dir = self.hf_api.snapshot_download(
-                        repo_id=QUEUE_REPO,
-                        repo_type="dataset",
-                        token=self.token
-                    )
+                local_dir = await asyncio.to_thread(
+                    self.hf_api.snapshot_download,
+                    repo_id=QUEUE_REPO,
+                    repo_type="dataset",
+                    revision=revision,
+                    token=self.token
+                )
                 
                 # List JSON files in local directory
                 local_path = Path(local_dir)
@@ -324,16 +337,164 @@ class ModelService(HuggingFaceService):
                 raise
             
             # Update cache
-            self.cached_models = models
-            self.last_cache_update = time.time()
+            self._set_cached_models(models)
+            self._queue_revision = revision
             logger.info(LogFormatter.success("Cache updated successfully"))
             
+            self._write_queue_manifest(models, revision)
+            
             return models
             
         except Exception as e:
             logger.error(LogFormatter.error("Cache refresh failed", e))
             raise
 
+    def _set_cached_models(self, models: Dict[str, List[Dict[str, Any]]], updated_at: Optional[float] = None):
+        """Replace the models cache and rebuild its lookup indexes
+        
+        updated_at is when the models were read from the hub, now by default.
+        """
+        submission_index = {}
+        for status, status_models in models.items():
+            for model in status_models:
+                submission_index[(model["name"], model["revision"])] = status
+        
+        self.cached_models = models
+        self._submission_index = submission_index
+        self._finished_model_names = {model["name"] for model in models.get("finished", [])}
+        self.last_cache_update = time.time() if updated_at is None else updated_at
+
+    def _record_submission(self, eval_entry: Dict[str, Any]):
+        """Add a freshly uploaded submission to the cache so it is seen before the next refresh"""
+        if self.cached_models is None:
+            return
+        
+        self.cached_models["pending"].append({
+            "name": eval_entry["model"],
+            "submitter": eval_entry["sender"],
+            "revision": eval_entry["revision"],
+            "wait_time": "0.0s",
+            "submission_time": eval_entry["submitted_time"],
+            "status": "PENDING",
+            "precision": eval_entry["precision"]
+        })
+        self._submission_index[(eval_entry["model"], eval_entry["revision"])] = "pending"
+
+    async def _get_queue_revision(self) -> Optional[str]:
+        """Get the current commit sha of the requests repository"""
+        try:
+            info = await asyncio.to_thread(
+                self.hf_api.dataset_info,
+                QUEUE_REPO,
+                token=self.token
+            )
+            return info.sha
+        except Exception as e:
+            logger.warning(LogFormatter.warning(f"Failed to get queue revision: {e}"))
+            return None
+
+    def _write_queue_manifest(self, models: Dict[str, List[Dict[str, Any]]], revision: Optional[str]):
+        """Write the parsed queue to a compact columnar manifest"""
+        try:
+            records = [model for status_models in models.values() for model in status_models]
+            manifest = {
+                "version": MANIFEST_VERSION,
+                "revision": revision,
+                "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "columns": {
+                    column: [record[column] for record in records]
+                    for column in MANIFEST_COLUMNS
+                }
+            }
+            
+            # Write atomically so a crash never leaves a truncated manifest behind
+            self.queue_manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode='w',
+                dir=self.queue_manifest_path.parent,
+                suffix='.tmp',
+                delete=False
+            ) as temp_file:
+                json.dump(manifest, temp_file, separators=(",", ":"))
+                temp_path = temp_file.name
+            os.replace(temp_path, self.queue_manifest_path)
+            
+            logger.info(LogFormatter.success(f"Queue manifest written ({len(records):,} records)"))
+        except Exception as e:
+            logger.error(LogFormatter.error("Failed to write queue manifest", e))
+
+    def _load_queue_manifest(self) -> Optional[Tuple[Dict[str, List[Dict[str, Any]]], float]]:
+        """Load the queue from the local manifest, if a valid one exists
+        
+        Returns:
+            Optional[Tuple[Dict, float]]: The models and the time the manifest was generated at
+        """
+        if not self.queue_manifest_path.exists():
+            return None
+        
+        try:
+            with open(self.queue_manifest_path, 'r') as f:
+                manifest = json.load(f)
+            
+            if manifest.get("version") != MANIFEST_VERSION:
+                logger.info(LogFormatter.info("Queue manifest version mismatch, ignoring it"))
+                return None
+            
+            columns = manifest["columns"]
+            current_time = datetime.now(timezone.utc)
+            models = {
+                "finished": [],
+                "evaluating": [],
+                "pending": []
+            }
+            
+            for values in zip(*(columns[column] for column in MANIFEST_COLUMNS)):
+                model_info = dict(zip(MANIFEST_COLUMNS, values))
+                
+                # Wait time depends on the current time, so it is recomputed on load
+                submit_time = datetime.fromisoformat(model_info["submission_time"].replace("Z", "+00:00"))
+                if submit_time.tzinfo is None:
+                    submit_time = submit_time.replace(tzinfo=timezone.utc)
+                model_info["wait_time"] = f"{(current_time - submit_time).total_seconds():.1f}s"
+                
+                models[model_info["status"].lower()].append(model_info)
+            
+            self._queue_revision = manifest.get("revision")
+            
+            # A manifest without a generation time is treated as expired
+            generated_at = manifest.get("generated_at")
+            updated_at = datetime.fromisoformat(generated_at.replace("Z", "+00:00")).timestamp() if generated_at else 0
+            
+            stats = {
+                "Revision": self._queue_revision or "Unknown",
+                "Generated_At": manifest.get("generated_at", "Unknown"),
+                "Finished": len(models["finished"]),
+                "Evaluating": len(models["evaluating"]),
+                "Pending": len(models["pending"])
+            }
+            for line in LogFormatter.stats(stats, "Queue Manifest"):
+                logger.info(line)
+            
+            return models, updated_at
+            
+        except Exception as e:
+            logger.warning(LogFormatter.warning(f"Failed to load queue manifest: {e}"))
+            return None
+
+    async def _reconcile_with_hub(self):
+        """Refresh the cache in the background if the requests repository moved on"""
+        try:
+            revision = await self._get_queue_revision()
+            if revision and revision == self._queue_revision:
+                logger.info(LogFormatter.success("Queue manifest is up to date with the hub"))
+                self.last_cache_update = time.time()
+                return
+            
+            logger.info(LogFormatter.info(f"Queue manifest is stale ({self._queue_revision} -> {revision}), refreshing..."))
+            await self._refresh_models_cache()
+        except Exception as e:
+            logger.error(LogFormatter.error("Background queue reconciliation failed", e))
+
     async def initialize(self):
         """Initialize the model service"""
         if self._initialized:
@@ -365,8 +526,15 @@ class ModelService(HuggingFaceService):
                 for line in LogFormatter.stats(stats, "Eval Requests"):
                     logger.info(line)
             
-            # Load initial cache
-            await self._refresh_models_cache()
+            # Serve from the local manifest if there is one, and reconcile in the background
+            manifest = self._load_queue_manifest()
+            if manifest is not None:
+                self._set_cached_models(*manifest)
+                self._reconcile_task = asyncio.create_task(self._reconcile_with_hub())
+                logger.info(LogFormatter.info("Serving from queue manifest, reconciling with hub in background"))
+            else:
+                # Load initial cache
+                await self._refresh_models_cache()
             
             self._initialized = True
             logger.info(LogFormatter.success("Model service initialization complete"))
@@ -388,6 +556,10 @@ class ModelService(HuggingFaceService):
         if not self.cached_models:
             logger.info(LogFormatter.info("No cached data available, refreshing cache..."))
             return await self._refresh_models_cache()
+        elif cache_age > self.cache_ttl and self._reconcile_task is not None and not self._reconcile_task.done():
+            # Reads keep being served from the manifest until the background reconciliation lands
+            logger.info(LogFormatter.info(f"Cache expired ({cache_age:.1f}s old), serving manifest while reconciling with hub"))
+            return self.cached_models
         elif cache_age > self.cache_ttl:
             logger.info(LogFormatter.info(f"Cache expired ({cache_age:.1f}s old, TTL: {self.cache_ttl}s)"))
             return await self._refresh_models_cache()
@@ -395,11 +567,18 @@ class ModelService(HuggingFaceService):
             logger.info(LogFormatter.info(f"Using cached data ({cache_age:.1f}s old)"))
             return self.cached_models
 
-    async def submit_model(
-        self, 
+    async def _prepare_submission(
+        self,
         model_data: Dict[str, Any],
-        user_id: str
+        user_id: str,
+        report_stage: Callable[[str], None]
     ) -> Dict[str, Any]:
+        """Validate a submission and build its eval request entry"""
+        # Validate required fields
+        for field in REQUIRED_SUBMISSION_FIELDS:
+            if field not in model_data:
+                raise ValueError(f"Missing required field: {field}")
+
         logger.info(LogFormatter.section("MODEL SUBMISSION"))
         self._log_repo_operation("write", f"{HF_ORGANIZATION}/requests", f"Submitting model {model_data['model_id']} by {user_id}")
         stats = {
@@ -411,22 +590,15 @@ class ModelService(HuggingFaceService):
         }
         for line in LogFormatter.tree(stats, "Submission Details"):
             logger.info(line)
-        
-        # Validate required fields
-        required_fields = [
-            "model_id", "base_model", "revision", "precision",
-            "weight_type", "model_type", "use_chat_template"
-        ]
-        for field in required_fields:
-            if field not in model_data:
-                raise ValueError(f"Missing required field: {field}")
 
         # Get model info and validate it exists on HuggingFace
+        report_stage("resolving_revision")
         try:
             logger.info(LogFormatter.subsection("MODEL VALIDATION"))
             
             # Get the model info to check if it exists
-            model_info = self.hf_api.model_info(
+            model_info = await asyncio.to_thread(
+                self.hf_api.model_info,
                 model_data["model_id"],
                 revision=model_data["revision"],
                 token=self.token
@@ -445,25 +617,29 @@ class ModelService(HuggingFaceService):
         model_data["revision"] = model_info.sha
 
         # Check if model already exists in the system
+        report_stage("checking_existing_submissions")
         try:
             logger.info(LogFormatter.subsection("CHECKING EXISTING SUBMISSIONS"))
-            existing_models = await self.get_models()
+            # A cache served from the manifest must be reconciled with the hub before checking against it
+            if self._reconcile_task is not None:
+                await asyncio.shield(self._reconcile_task)
+            # Make sure the cache and its indexes are fresh
+            await self.get_models()
             
             # Call the official provider status check
             is_valid, error_message = await self.validator.check_official_provider_status(
                 model_data["model_id"],
-                existing_models
+                self._finished_model_names
             )
             if not is_valid:
                 raise ValueError(error_message)
 
             # Check in all statuses (pending, evaluating, finished)
-            for status, models in existing_models.items():
-                for model in models:
-                    if model["name"] == model_data["model_id"] and model["revision"] == model_data["revision"]:
-                        error_msg = f"Model {model_data['model_id']} revision {model_data['revision']} is already in the system with status: {status}"
-                        logger.error(LogFormatter.error("Submission rejected", error_msg))
-                        raise ValueError(error_msg)
+            status = self._submission_index.get((model_data["model_id"], model_data["revision"]))
+            if status:
+                error_msg = f"Model {model_data['model_id']} revision {model_data['revision']} is already in the system with status: {status}"
+                logger.error(LogFormatter.error("Submission rejected", error_msg))
+                raise ValueError(error_msg)
             
             logger.info(LogFormatter.success("No existing submission found"))
         except ValueError:
@@ -472,55 +648,19 @@ class ModelService(HuggingFaceService):
             logger.error(LogFormatter.error("Failed to check existing submissions", e))
             raise
 
-        # Check that model on hub and valid
-        valid, error, model_config = await self.validator.is_model_on_hub(
-            model_data["model_id"], 
-            model_data["revision"], 
-            test_tokenizer=True
-        )
-        if not valid:
-            logger.error(LogFormatter.error("Model on hub validation failed", error))
-            raise Exception(error)
-        logger.info(LogFormatter.success("Model on hub validation passed"))
-
-        # Validate model card
-        valid, error, model_card = await self.validator.check_model_card(
-            model_data["model_id"]
-        )
-        if not valid:
-            logger.error(LogFormatter.error("Model card validation failed", error))
-            raise Exception(error)
-        logger.info(LogFormatter.success("Model card validation passed"))
-
-        # Check size limits
-        model_size, error = await self.validator.get_model_size(
-            model_info,
-            model_data["precision"],
-            model_data["base_model"],
-            revision=model_data["revision"]
-        )
-        if model_size is None:
-            logger.error(LogFormatter.error("Model size validation failed", error))
-            raise Exception(error)
-        logger.info(LogFormatter.success(f"Model size validation passed: {model_size:.1f}B"))
-
-        # Size limits based on precision
-        if model_data["precision"] in ["float16", "bfloat16"] and model_size > 100:
-            error_msg = f"Model too large for {model_data['precision']} (limit: 100B)"
-            logger.error(LogFormatter.error("Size limit exceeded", error_msg))
-            raise Exception(error_msg)
-
-        # Chat template validation if requested
+        # Run the independent hub checks concurrently now that the revision is pinned
+        report_stage("validating")
+        logger.info(LogFormatter.subsection("HUB VALIDATION"))
+        checks = [
+            self._check_model_on_hub(model_data),
+            self._check_model_card(model_data),
+            self._check_model_size(model_info, model_data)
+        ]
         if model_data["use_chat_template"]:
-            valid, error = await self.validator.check_chat_template(
-                model_data["model_id"],
-                model_data["revision"]
-            )
-            if not valid:
-                logger.error(LogFormatter.error("Chat template validation failed", error))
-                raise Exception(error)
-            logger.info(LogFormatter.success("Chat template validation passed"))
-
+            checks.append(self._check_chat_template(model_data))
+        
+        results = await self._run_validation_checks(checks)
+        model_size = results[2]
 
         architectures = model_info.config.get("architectures", "")     
         if architectures:
@@ -547,16 +687,62 @@ class ModelService(HuggingFaceService):
         logger.info(LogFormatter.subsection("EVALUATION ENTRY"))
         for line in LogFormatter.tree(eval_entry):
             logger.info(line)
+        
+        return eval_entry
+
+    def _get_request_path(self, model_data: Dict[str, Any]) -> str:
+        """Get the path of a submission's eval request in the requests dataset"""
+        org_or_user = model_data["model_id"].split("/")[0] if "/" in model_data["model_id"] else ""
+        model_path = model_data["model_id"].split("/")[-1]
+        return f"{org_or_user}/{model_path}_eval_request_False_{model_data['precision']}_{model_data['weight_type']}.json"
+
+    async def _add_submission_vote(self, model_data: Dict[str, Any], user_id: str):
+        """Record the submitter's automatic upvote"""
+        try:
+            logger.info(LogFormatter.subsection("AUTOMATIC VOTE"))
+            logger.info(LogFormatter.info(f"Adding upvote for {model_data['model_id']} by {user_id}"))
+            await self.vote_service.initialize()
+            await self.vote_service.add_vote(
+                model_data["model_id"],
+                user_id,
+                "up",
+                {
+                    "precision": model_data["precision"],
+                    "revision": model_data["revision"]
+                }
+            )
+            logger.info(LogFormatter.success("Vote recorded successfully"))
+        except Exception as e:
+            logger.error(LogFormatter.error("Failed to record vote", e))
+            # Don't raise here as the main submission was successful
+
+    async def submit_model(
+        self, 
+        model_data: Dict[str, Any],
+        user_id: str,
+        on_stage: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """Validate a model and add it to the evaluation queue
+        
+        Args:
+            model_data: Submission fields, see REQUIRED_SUBMISSION_FIELDS
+            user_id: HuggingFace username of the submitter
+            on_stage: Optional callback notified when the submission enters a new stage
+        """
+        def report_stage(stage: str):
+            if on_stage:
+                on_stage(stage)
+        
+        eval_entry = await self._prepare_submission(model_data, user_id, report_stage)
 
         # Upload to HF dataset
+        report_stage("uploading")
         try:
             logger.info(LogFormatter.subsection("UPLOADING TO HUGGINGFACE"))
             logger.info(LogFormatter.info(f"Uploading to {HF_ORGANIZATION}/requests..."))
             
             # Construct the path in the dataset
-            org_or_user = model_data["model_id"].split("/")[0] if "/" in model_data["model_id"] else ""
-            model_path = model_data["model_id"].split("/")[-1]
-            relative_path = f"{org_or_user}/{model_path}_eval_request_False_{model_data['precision']}_{model_data['weight_type']}.json"
+            relative_path = self._get_request_path(model_data)
             
             # Create a temporary file with the request
             with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
@@ -565,7 +751,8 @@ class ModelService(HuggingFaceService):
                 temp_path = temp_file.name
             
             # Upload file directly
-            self.hf_api.upload_file(
+            await asyncio.to_thread(
+                self.hf_api.upload_file,
                 path_or_fileobj=temp_path,
                 path_in_repo=relative_path,
                 repo_id=f"{HF_ORGANIZATION}/requests",
@@ -577,6 +764,7 @@ class ModelService(HuggingFaceService):
             # Clean up temp file
             os.unlink(temp_path)
             
+            self._record_submission(eval_entry)
             logger.info(LogFormatter.success("Upload successful"))
             
         except Exception as e:
@@ -584,28 +772,190 @@ class ModelService(HuggingFaceService):
             raise
 
         # Add automatic vote
-        try:
-            logger.info(LogFormatter.subsection("AUTOMATIC VOTE"))
-            logger.info(LogFormatter.info(f"Adding upvote for {model_data['model_id']} by {user_id}"))
-            await self.vote_service.add_vote(
-                model_data["model_id"],
-                user_id,
-                "up",
-                {
-                    "precision": model_data["precision"],
-                    "revision": model_data["revision"]
-                }
-            )
-            logger.info(LogFormatter.success("Vote recorded successfully"))
-        except Exception as e:
-            logger.error(LogFormatter.error("Failed to record vote", e))
-            # Don't raise here as the main submission was successful
+        report_stage("voting")
+        await self._add_submission_vote(model_data, user_id)
 
         return {
             "status": "success",
             "message": "The model was submitted successfully, and the vote has been recorded"
         }
 
+    async def submit_models_batch(
+        self,
+        models_data: List[Dict[str, Any]],
+        user_id: str,
+        on_stage: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """Validate several models concurrently and add the accepted ones in a single commit
+        
+        Returns:
+            Dict with overall status and a per-model list of results, in submission order
+        """
+        def report_stage(stage: str):
+            if on_stage:
+                on_stage(stage)
+        
+        logger.info(LogFormatter.section("BATCH MODEL SUBMISSION"))
+        self._log_repo_operation("write", f"{HF_ORGANIZATION}/requests", f"Submitting {len(models_data)} models by {user_id}")
+        
+        semaphore = asyncio.Semaphore(BATCH_VALIDATION_CONCURRENCY)
+        
+        async def prepare(model_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._prepare_submission(model_data, user_id, lambda stage: None)
+        
+        report_stage("validating")
+        outcomes = await asyncio.gather(
+            *(prepare(model_data) for model_data in models_data),
+            return_exceptions=True
+        )
+        
+        results = []
+        accepted = []
+        seen_submissions = set()
+        seen_paths = set()
+        for model_data, outcome in zip(models_data, outcomes):
+            model_id = model_data.get("model_id")
+            if isinstance(outcome, BaseException):
+                results.append({"model_id": model_id, "status": "rejected", "error": str(outcome)})
+                continue
+            
+            # Same rule as _prepare_submission: one submission per (model, resolved revision)
+            submission_key = (outcome["model"], outcome["revision"])
+            if submission_key in seen_submissions:
+                results.append({"model_id": model_id, "status": "rejected", "error": f"Model {model_id} revision {outcome['revision']} is already in this batch"})
+                continue
+            
+            # Two entries of the same batch must not overwrite each other's request file
+            relative_path = self._get_request_path(model_data)
+            if relative_path in seen_paths:
+                results.append({"model_id": model_id, "status": "rejected", "error": f"Duplicate entry in batch: {relative_path}"})
+                continue
+            seen_submissions.add(submission_key)
+            seen_paths.add(relative_path)
+            
+            results.append({"model_id": model_id, "status": "accepted", "error": None})
+            accepted.append((model_data, relative_path, outcome))
+        
+        if accepted:
+            report_stage("uploading")
+            try:
+                logger.info(LogFormatter.subsection("UPLOADING TO HUGGINGFACE"))
+                logger.info(LogFormatter.info(f"Committing {len(accepted)} requests to {HF_ORGANIZATION}/requests..."))
+                
+                operations = [
+                    CommitOperationAdd(
+                        path_in_repo=relative_path,
+                        path_or_fileobj=json.dumps(eval_entry, indent=2).encode()
+                    )
+                    for _, relative_path, eval_entry in accepted
+                ]
+                await asyncio.to_thread(
+                    self.hf_api.create_commit,
+                    repo_id=f"{HF_ORGANIZATION}/requests",
+                    repo_type="dataset",
+                    operations=operations,
+                    commit_message=f"Add {len(accepted)} models to eval queue",
+                    token=self.token
+                )
+                for _, _, eval_entry in accepted:
+                    self._record_submission(eval_entry)
+                logger.info(LogFormatter.success("Upload successful"))
+                
+            except Exception as e:
+                logger.error(LogFormatter.error("Upload failed", e))
+                for result in results:
+                    if result["status"] == "accepted":
+                        result["status"] = "rejected"
+                        result["error"] = f"Upload failed: {e}"
+                accepted = []
+        
+        report_stage("voting")
+        for model_data, _, _ in accepted:
+            await self._add_submission_vote(model_data, user_id)
+        
+        stats = {
+            "Total": len(models_data),
+            "Success": len(accepted),
+            "Error": len(models_data) - len(accepted)
+        }
+        for line in LogFormatter.stats(stats, "Batch Summary"):
+            logger.info(line)
+        
+        return {
+            "status": "success" if accepted else "error",
+            "message": f"{len(accepted)} of {len(models_data)} models were submitted",
+            "results": results
+        }
+
+    async def _run_validation_checks(self, checks: List[Any]) -> List[Any]:
+        """Run validation coroutines concurrently, cancelling the rest on the first failure"""
+        tasks = [asyncio.create_task(check) for check in checks]
+        try:
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+            return [task.result() for task in tasks]
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _check_model_on_hub(self, model_data: Dict[str, Any]) -> None:
+        """Check that the model config and tokenizer load from the hub"""
+        valid, error, _ = await self.validator.is_model_on_hub(
+            model_data["model_id"], 
+            model_data["revision"], 
+            test_tokenizer=True
+        )
+        if not valid:
+            logger.error(LogFormatter.error("Model on hub validation failed", error))
+            raise Exception(error)
+        logger.info(LogFormatter.success("Model on hub validation passed"))
+
+    async def _check_model_card(self, model_data: Dict[str, Any]) -> None:
+        """Check that the model has a valid model card"""
+        valid, error, _ = await self.validator.check_model_card(
+            model_data["model_id"]
+        )
+        if not valid:
+            logger.error(LogFormatter.error("Model card validation failed", error))
+            raise Exception(error)
+        logger.info(LogFormatter.success("Model card validation passed"))
+
+    async def _check_model_size(self, model_info: Any, model_data: Dict[str, Any]) -> float:
+        """Check that the model size can be determined and is within limits"""
+        model_size, error = await self.validator.get_model_size(
+            model_info,
+            model_data["precision"],
+            model_data["base_model"],
+            revision=model_data["revision"]
+        )
+        if model_size is None:
+            logger.error(LogFormatter.error("Model size validation failed", error))
+            raise Exception(error)
+        logger.info(LogFormatter.success(f"Model size validation passed: {model_size:.1f}B"))
+
+        # Size limits based on precision
+        if model_data["precision"] in ["float16", "bfloat16"] and model_size > 100:
+            error_msg = f"Model too large for {model_data['precision']} (limit: 100B)"
+            logger.error(LogFormatter.error("Size limit exceeded", error_msg))
+            raise Exception(error_msg)
+        
+        return model_size
+
+    async def _check_chat_template(self, model_data: Dict[str, Any]) -> None:
+        """Check that the model has a chat template"""
+        valid, error = await self.validator.check_chat_template(
+            model_data["model_id"],
+            model_data["revision"]
+        )
+        if not valid:
+            logger.error(LogFormatter.error("Chat template validation failed", error))
+            raise Exception(error)
+        logger.info(LogFormatter.success("Chat template validation passed"))
+
     async def get_model_status(self, model_id: str) -> Dict[str, Any]:
         """Get evaluation status of a model"""
         logger.info(LogFormatter.info(f"Checking status for model: {model_id}"))
@@ -0,0 +1,267 @@
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, Optional, List
+import json
+import os
+import uuid
+import logging
+import asyncio
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from app.config import SUBMISSION_WORKERS, SUBMISSION_JOB_RETENTION_DAYS
+from app.core.cache import cache_config
+from app.core.formatting import LogFormatter
+from app.services.models import ModelService, REQUIRED_SUBMISSION_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# Job lifecycle
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+# Job kinds
+JOB_KIND_SINGLE = "single"
+JOB_KIND_BATCH = "batch"
+MAX_BATCH_SIZE = 50
+
+# The jobs log is compacted once it holds this many events per live job
+JOBS_LOG_COMPACTION_RATIO = 4
+JOBS_LOG_MIN_EVENTS = 1000
+
+class SubmissionQueue:
+    """Durable local queue of model submissions processed by background workers
+
+    Jobs are persisted as an append-only log of events, one JSON line per
+    created job or job update, written on a dedicated I/O thread so stage
+    changes cost O(1) and never block the event loop. A job creation reaches
+    the disk before the job is acknowledged.
+    """
+    _instance: Optional['SubmissionQueue'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SubmissionQueue, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, '_init_done'):
+            self.jobs_file = cache_config.submission_jobs_file
+            self.max_workers = SUBMISSION_WORKERS
+            self.retention = timedelta(days=SUBMISSION_JOB_RETENTION_DAYS)
+            self._jobs: Dict[str, Dict[str, Any]] = {}
+            self._queue: Optional[asyncio.Queue] = None
+            self._workers: List[asyncio.Task] = []
+            self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="submissions-io")
+            self._log_events = 0
+            self._load_jobs()
+            self._init_done = True
+
+    def _load_jobs(self):
+        """Replay the jobs log, dropping finished jobs past retention, and compact it"""
+        if not self.jobs_file.exists():
+            return
+
+        try:
+            with open(self.jobs_file, 'r') as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A line cut short by a crash only loses that event
+                        continue
+                    self._jobs.setdefault(event["job_id"], {}).update(event)
+
+            cutoff = datetime.now(timezone.utc) - self.retention
+            for job_id, job in list(self._jobs.items()):
+                updated_at = datetime.fromisoformat(job["updated_at"].replace("Z", "+00:00"))
+                if job["status"] in (JOB_COMPLETED, JOB_FAILED) and updated_at < cutoff:
+                    del self._jobs[job_id]
+
+            self._write_jobs_log(self.jobs_file, self._serialize_jobs())
+            self._log_events = len(self._jobs)
+
+            stats = {
+                "Total_Jobs": len(self._jobs),
+                "Pending": sum(1 for job in self._jobs.values() if job["status"] in (JOB_QUEUED, JOB_RUNNING))
+            }
+            for line in LogFormatter.stats(stats, "Submission Jobs"):
+                logger.info(line)
+
+        except Exception as e:
+            logger.error(LogFormatter.error("Failed to load submission jobs", e))
+
+    def _serialize_jobs(self) -> List[str]:
+        """Get one log line per job holding its full state"""
+        return [json.dumps(job) + "\n" for job in self._jobs.values()]
+
+    @staticmethod
+    def _append_job_event(path, line: str, fsync: bool = False):
+        """Append one event to the jobs log, optionally waiting for it to reach the disk"""
+        try:
+            with open(path, 'a') as f:
+                f.write(line)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+        except Exception as e:
+            logger.error(LogFormatter.error("Failed to persist submission job event", e))
+            if fsync:
+                raise
+
+    @staticmethod
+    def _write_jobs_log(path, lines: List[str]):
+        """Atomically replace the jobs log with the given lines"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode='w',
+                dir=path.parent,
+                suffix='.tmp',
+                delete=False
+            ) as temp_file:
+                temp_file.writelines(lines)
+                temp_path = temp_file.name
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.error(LogFormatter.error("Failed to compact submission jobs", e))
+
+    def _persist_event(self, event: Dict[str, Any], fsync: bool = False) -> Future:
+        """Queue a job event for the I/O thread, compacting the log when it grew too long
+        
+        Returns:
+            Future: Completes once the event is written
+        """
+        written = self._io_executor.submit(self._append_job_event, self.jobs_file, json.dumps(event) + "\n", fsync)
+        self._log_events += 1
+        if self._log_events > max(JOBS_LOG_MIN_EVENTS, JOBS_LOG_COMPACTION_RATIO * len(self._jobs)):
+            # The I/O thread runs in order, so the snapshot replaces every event queued before it
+            self._io_executor.submit(self._write_jobs_log, self.jobs_file, self._serialize_jobs())
+            self._log_events = len(self._jobs)
+        return written
+
+    def _update_job(self, job_id: str, **changes: Any):
+        """Apply changes to a job and persist them"""
+        job = self._jobs[job_id]
+        job.update(changes)
+        job["updated_at"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self._persist_event({"job_id": job_id, **changes, "updated_at": job["updated_at"]})
+
+    async def start(self):
+        """Start the workers and re-enqueue jobs interrupted by a restart"""
+        if self._queue is not None:
+            return
+
+        logger.info(LogFormatter.section("SUBMISSION QUEUE STARTUP"))
+        self._queue = asyncio.Queue()
+
+        # Jobs still running when the process stopped are restarted from scratch
+        unfinished = sorted(
+            (job for job in self._jobs.values() if job["status"] in (JOB_QUEUED, JOB_RUNNING)),
+            key=lambda job: job["created_at"]
+        )
+        for job in unfinished:
+            if job["status"] == JOB_RUNNING:
+                self._update_job(job["job_id"], status=JOB_QUEUED, stage="requeued")
+            self._queue.put_nowait(job["job_id"])
+
+        for i in range(self.max_workers):
+            self._workers.append(asyncio.create_task(self._worker(i)))
+
+        logger.info(LogFormatter.success(f"Started {self.max_workers} submission workers ({len(unfinished)} jobs recovered)"))
+
+    async def submit(self, model_data: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+        """Accept a submission into the queue and return its job"""
+        for field in REQUIRED_SUBMISSION_FIELDS:
+            if field not in model_data:
+                raise ValueError(f"Missing required field: {field}")
+
+        return await self._enqueue(JOB_KIND_SINGLE, model_data["model_id"], model_data, user_id)
+
+    async def submit_batch(self, models_data: List[Dict[str, Any]], user_id: str) -> Dict[str, Any]:
+        """Accept several submissions as one job committed together"""
+        if not models_data:
+            raise ValueError("At least one model is required")
+        if len(models_data) > MAX_BATCH_SIZE:
+            raise ValueError(f"A batch can contain at most {MAX_BATCH_SIZE} models")
+        if any(not isinstance(model_data, dict) or "model_id" not in model_data for model_data in models_data):
+            raise ValueError("Missing required field: model_id")
+
+        model_ids = ",".join(model_data["model_id"] for model_data in models_data)
+        return await self._enqueue(JOB_KIND_BATCH, model_ids, models_data, user_id)
+
+    async def _enqueue(self, kind: str, model_id: str, model_data: Any, user_id: str) -> Dict[str, Any]:
+        """Persist a new job and hand it to the workers"""
+        await self.start()
+
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        job_id = uuid.uuid4().hex
+        self._jobs[job_id] = {
+            "job_id": job_id,
+            "kind": kind,
+            "model_id": model_id,
+            "user_id": user_id,
+            "model_data": model_data,
+            "status": JOB_QUEUED,
+            "stage": "queued",
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now
+        }
+        try:
+            # The job must survive a crash once it is acknowledged, stage updates need not
+            await asyncio.wrap_future(self._persist_event(self._jobs[job_id], fsync=True))
+        except Exception:
+            del self._jobs[job_id]
+            raise
+        self._queue.put_nowait(job_id)
+
+        logger.info(LogFormatter.success(f"Submission job {job_id} queued for {model_id}"))
+        return self.get_job(job_id)
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get the public view of a job"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        return {key: value for key, value in job.items() if key != "model_data"}
+
+    async def _worker(self, worker_id: int):
+        """Process queued submissions one at a time"""
+        model_service = ModelService()
+        while True:
+            job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            try:
+                if job is None or job["status"] != JOB_QUEUED:
+                    continue
+
+                logger.info(LogFormatter.info(f"Worker {worker_id} processing job {job_id} ({job['model_id']})"))
+                self._update_job(job_id, status=JOB_RUNNING, stage="starting")
+
+                await model_service.initialize()
+                on_stage = lambda stage: self._update_job(job_id, stage=stage)
+                if job.get("kind", JOB_KIND_SINGLE) == JOB_KIND_BATCH:
+                    result = await model_service.submit_models_batch(
+                        [dict(model_data) for model_data in job["model_data"]],
+                        job["user_id"],
+                        on_stage=on_stage
+                    )
+                else:
+                    result = await model_service.submit_model(
+                        dict(job["model_data"]),
+                        job["user_id"],
+                        on_stage=on_stage
+                    )
+                self._update_job(job_id, status=JOB_COMPLETED, stage="done", result=result)
+                logger.info(LogFormatter.success(f"Submission job {job_id} completed"))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(LogFormatter.error(f"Submission job {job_id} failed", e))
+                self._update_job(job_id, status=JOB_FAILED, error=str(e))
+            finally:
+                self._queue.task_done()
@@ -5,18 +5,33 @@ import logging
 import asyncio
 from pathlib import Path
 import aiohttp
-from huggingface_hub import HfApi
+from huggingface_hub import HfApi, CommitOperationAdd, CommitOperationDelete
+from huggingface_hub.utils import EntryNotFoundError
 import tempfile
 import os
+import uuid
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from app.services.hf_service import HuggingFaceService
 from app.config import HF_TOKEN
-from app.config.hf_config import HF_ORGANIZATION
+from app.config.hf_config import HF_ORGANIZATION, VOTES_REPO, VOTES_BASE_FILE, VOTES_SHARDS_DIR
 from app.core.cache import cache_config
 from app.core.formatting import LogFormatter
+from app.core.vote_store import VoteStore
 
 logger = logging.getLogger(__name__)
 
+VOTES_PAGE_MAX_LIMIT = 1000
+TRENDING_MAX_WINDOW = 30 * 24 * 3600
+TRENDING_MAX_LIMIT = 100
+SUMMARY_MAX_MODELS = 200
+VOTES_WRITE_BATCH = 1000  # lines per write when streaming remote votes to disk
+VOTES_COMPACTION_SHARDS = 100  # shards folded back into the base file at once
+MODEL_INFO_CACHE_TTL = 300  # seconds
+MODEL_INFO_CACHE_SIZE = 1024
+
 class VoteService(HuggingFaceService):
     _instance: Optional['VoteService'] = None
     _initialized = False
@@ -30,169 +45,746 @@ class VoteService(HuggingFaceService):
         if not hasattr(self, '_init_done'):
             super().__init__()
             self.votes_file = cache_config.votes_file
+            self.votes_state_file = cache_config.votes_state_file
+            self.votes_pending_file = cache_config.votes_pending_file  # write-ahead log of votes_to_upload
             self.votes_to_upload: List[Dict[str, Any]] = []
-            self.vote_check_set: Set[Tuple[str, str, str, str]] = set()
-            self._votes_by_model: Dict[str, List[Dict[str, Any]]] = {}
-            self._votes_by_user: Dict[str, List[Dict[str, Any]]] = {}
+            self._store = VoteStore()
+            self._model_stats: Dict[str, Dict[str, Any]] = {}  # per-model totals, kept in sync with _store
             self._last_sync = None
-            self._sync_interval = 300  # 5 minutes
+            self._sync_interval = 60  # seconds between background freshness checks
+            self._sync_task: Optional[asyncio.Task] = None
+            self._sync_lock = asyncio.Lock()
+            self._init_lock = asyncio.Lock()
+            self._init_task: Optional[asyncio.Task] = None
             self._total_votes = 0
             self._last_vote_timestamp = None
+            self._remote_revision: Optional[str] = None
+            self._base_etag: Optional[str] = None
+            self._base_size: Optional[int] = None  # bytes of the base file merged so far
+            self._base_tail: Optional[str] = None  # last line of the base file merged so far
+            self._synced_shards: Set[str] = set()
+            self._remote_shards: List[str] = []  # shards listed at _remote_revision
             self._max_retries = 3
             self._retry_delay = 1  # seconds
+            self._flush_interval = 10  # seconds a batch stays open
+            self._flush_batch_size = 100  # votes that close a batch early
+            self._flush_max_backoff = 300  # seconds
+            self._flush_event: Optional[asyncio.Event] = None
+            self._flush_task: Optional[asyncio.Task] = None
+            # One thread keeps vote file writes ordered and off the event loop
+            self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="votes-io")
+            self._write_lock = asyncio.Lock()
+            # model id -> (expiry, (sha, card precision)), least recently used first
+            self._model_info_cache: OrderedDict[str, Tuple[float, Tuple[str, str]]] = OrderedDict()
+            self._model_info_pending: Dict[str, asyncio.Task] = {}
             self.hf_api = HfApi(token=HF_TOKEN)
             self._init_done = True
 
     async def initialize(self):
-        """Initialize the vote service"""
+        """Initialize the vote service
+        
+        Only the first call does any hub I/O; freshness checks afterwards run
+        in the background sync task.
+        """
         if self._initialized:
-            await self._check_for_new_votes()
             return
         
-        try:
-            logger.info(LogFormatter.section("VOTE SERVICE INITIALIZATION"))
-            
-            # Ensure votes directory exists
-            self.votes_file.parent.mkdir(parents=True, exist_ok=True)
+        async with self._init_lock:
+            if self._initialized:
+                return
             
-            # Load remote votes
-            remote_votes = await self._fetch_remote_votes()
-            if remote_votes:
-                logger.info(LogFormatter.info(f"Loaded {len(remote_votes)} votes from hub"))
+            try:
+                logger.info(LogFormatter.section("VOTE SERVICE INITIALIZATION"))
                 
-                # Save to local file
-                with open(self.votes_file, 'w') as f:
-                    for vote in remote_votes:
-                        json.dump(vote, f)
-                        f.write('\n')
+                # Ensure votes directory exists
+                self.votes_file.parent.mkdir(parents=True, exist_ok=True)
+                await self._load_votes_state()
                 
-                # Load into memory
+                # Load the local votes log into memory
                 await self._load_existing_votes()
-            else:
-                logger.warning(LogFormatter.warning("No votes found on hub"))
-            
-            self._initialized = True
-            self._last_sync = datetime.now(timezone.utc)
-            
-            # Final summary
-            stats = {
-                "Total_Votes": self._total_votes,
-                "Last_Sync": self._last_sync.strftime("%Y-%m-%d %H:%M:%S UTC")
-            }
-            logger.info(LogFormatter.section("INITIALIZATION COMPLETE"))
-            for line in LogFormatter.stats(stats):
-                logger.info(line)
+                
+                # Votes accepted before a restart but never uploaded
+                await self._load_pending_votes()
+                
+                # Stream whatever the hub has on top of it
+                try:
+                    await self._pull_remote_votes()
+                except Exception as e:
+                    logger.warning(LogFormatter.warning(f"Failed to pull remote votes, using local votes: {str(e)}"))
+                
+                if not self._total_votes:
+                    logger.warning(LogFormatter.warning("No votes found on hub"))
+                
+                self._initialized = True
+                self._last_sync = datetime.now(timezone.utc)
+                
+                # Keep merging votes from other workers outside of the request path
+                self._start_background_sync()
+                if self.votes_to_upload:
+                    self._schedule_flush()
+                
+                # Final summary
+                stats = {
+                    "Total_Votes": self._total_votes,
+                    "Shards": len(self._synced_shards),
+                    "Last_Sync": self._last_sync.strftime("%Y-%m-%d %H:%M:%S UTC")
+                }
+                logger.info(LogFormatter.section("INITIALIZATION COMPLETE"))
+                for line in LogFormatter.stats(stats):
+                    logger.info(line)
             
+            except Exception as e:
+                logger.error(LogFormatter.error("Initialization failed", e))
+                raise
+
+    def start_initialization(self):
+        """Initialize the service in the background, keeping a reference to the task"""
+        if self._init_task is None or self._init_task.done():
+            self._init_task = asyncio.create_task(self.initialize())
+
+    async def _run_io(self, func, *args, **kwargs):
+        """Run blocking file I/O on the vote I/O thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_executor, functools.partial(func, *args, **kwargs))
+
+    @staticmethod
+    def _append_lines(path: Path, lines: List[bytes], fsync: bool = False):
+        """Append lines to a file, optionally waiting for them to reach the disk"""
+        with open(path, "ab") as f:
+            f.writelines(lines)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    @staticmethod
+    def _append_vote_lines(votes_path: Path, pending_path: Path, line: bytes):
+        """Durably append a vote to the pending votes log, then to the votes log
+        
+        The pending log comes first: a vote only it holds is restored to the
+        votes log on restart, while one only in the votes log would never be
+        uploaded.
+        """
+        VoteService._append_lines(pending_path, [line], fsync=True)
+        VoteService._append_lines(votes_path, [line], fsync=True)
+
+    @staticmethod
+    def _write_lines_atomic(path: Path, lines: List[bytes]):
+        """Replace a file with the given lines through a temporary file and rename"""
+        with tempfile.NamedTemporaryFile(mode='wb', dir=path.parent, suffix='.tmp', delete=False) as temp_file:
+            temp_file.writelines(lines)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+            temp_path = temp_file.name
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _read_json(path: Path) -> Optional[Any]:
+        """Read a JSON file, None if it does not exist"""
+        if not path.exists():
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_json_atomic(path: Path, data: Any):
+        """Write a JSON file through a temporary file and rename"""
+        with tempfile.NamedTemporaryFile(mode='w', dir=path.parent, suffix='.tmp', delete=False) as temp_file:
+            json.dump(data, temp_file)
+            temp_path = temp_file.name
+        os.replace(temp_path, path)
+
+    async def _load_votes_state(self):
+        """Load which remote votes are already merged into the local votes file"""
+        self._remote_revision = None
+        self._base_etag = None
+        self._base_size = None
+        self._base_tail = None
+        self._synced_shards = set()
+        
+        if not self.votes_file.exists():
+            return
+        
+        try:
+            state = await self._run_io(self._read_json, self.votes_state_file)
+            if state is None:
+                return
+            self._remote_revision = state.get("revision")
+            self._base_etag = state.get("base_etag")
+            self._base_size = state.get("base_size")
+            self._base_tail = state.get("base_tail")
+            self._synced_shards = set(state["shards"])
         except Exception as e:
-            logger.error(LogFormatter.error("Initialization failed", e))
-            raise
+            logger.warning(LogFormatter.warning(f"Ignoring invalid votes state: {str(e)}"))
+
+    async def _save_votes_state(self):
+        """Persist which remote votes are merged into the local votes file"""
+        await self._run_io(self._write_json_atomic, self.votes_state_file, {
+            "revision": self._remote_revision,
+            "base_etag": self._base_etag,
+            "base_size": self._base_size,
+            "base_tail": self._base_tail,
+            "shards": sorted(self._synced_shards)
+        })
 
-    async def _fetch_remote_votes(self) -> List[Dict[str, Any]]:
-        """Fetch votes from HF hub"""
-        url = f"https://huggingface.co/datasets/{HF_ORGANIZATION}/votes/raw/main/votes_data.jsonl"
+    async def _get_remote_state(self, revision: str = "main") -> Optional[Tuple[str, Optional[str]]]:
+        """Get the votes dataset commit sha and base file ETag with a single HEAD request
+        
+        The commit sha comes from the dataset info instead when there is no
+        base file to HEAD.
+        
+        Returns:
+            Optional[Tuple[str, Optional[str]]]: (commit sha, base file ETag or None if there is no base file),
+            None if the hub is unreachable
+        """
+        url = f"https://huggingface.co/datasets/{VOTES_REPO}/resolve/{revision}/{VOTES_BASE_FILE}"
         headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
         
         try:
             async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        votes = []
-                        async for line in response.content:
-                            if line.strip():
-                                try:
-                                    vote = json.loads(line.decode())
-                                    votes.append(vote)
-                                except json.JSONDecodeError:
-                                    continue
-                        return votes
-                    else:
-                        logger.error(f"Failed to get remote votes: HTTP {response.status}")
-                        return []
+                # LFS files redirect to the CDN, but the hub response already carries both headers
+                async with session.head(url, headers=headers, allow_redirects=False) as response:
+                    if response.status == 404:
+                        info = await asyncio.to_thread(
+                            self.hf_api.dataset_info,
+                            VOTES_REPO,
+                            revision=revision,
+                            token=self.token
+                        )
+                        return info.sha, None
+                    if response.status >= 400:
+                        logger.error(f"Failed to get remote votes revision: HTTP {response.status}")
+                        return None
+                    revision = response.headers.get("X-Repo-Commit")
+                    etag = response.headers.get("X-Linked-Etag") or response.headers.get("ETag")
+                    if not revision or not etag:
+                        logger.error("Failed to get remote votes revision: missing X-Repo-Commit or ETag header")
+                        return None
+                    return revision, etag
         except Exception as e:
-            logger.error(f"Error fetching remote votes: {str(e)}")
-            return []
+            logger.error(f"Error getting remote votes revision: {str(e)}")
+            return None
+
+    async def _stream_remote_votes(
+        self,
+        path_in_repo: str,
+        revision: str,
+        target_path: Path,
+        store: VoteStore,
+        model_stats: Dict[str, Dict[str, Any]],
+        seen_keys: Optional[Set[Tuple[str, str, str, str]]] = None
+    ) -> Tuple[int, int, bytes]:
+        """Stream a file of the HF hub votes dataset into a local votes file and the in-memory indexes
+        
+        Returns:
+            Tuple[int, int, bytes]: Number of votes read, bytes read and last line
+        """
+        url = f"https://huggingface.co/datasets/{VOTES_REPO}/resolve/{revision}/{path_in_repo}"
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    raise Exception(f"Failed to get remote votes from {path_in_repo}: HTTP {response.status}")
+                return await self._ingest_votes(response.content, target_path, store, model_stats, seen_keys)
+
+    async def _ingest_votes(
+        self,
+        content: aiohttp.StreamReader,
+        target_path: Path,
+        store: VoteStore,
+        model_stats: Dict[str, Dict[str, Any]],
+        seen_keys: Optional[Set[Tuple[str, str, str, str]]] = None
+    ) -> Tuple[int, int, bytes]:
+        """Write streamed vote lines to a local votes file and index them
+        
+        Lines are indexed as they arrive and appended to disk in batches on the
+        I/O thread, so memory stays bounded whatever the size of the stream.
+        Votes already in the store, e.g. shards folded into the base file, are
+        not written again. The check tuple of each vote is added to seen_keys
+        when given.
+        
+        Returns:
+            Tuple[int, int, bytes]: Number of votes read, bytes read and last line
+        """
+        vote_count = 0
+        size = 0
+        last_line = b""
+        pending: List[bytes] = []
+        async for line in content:
+            size += len(line)
+            last_line = line
+            if not line.strip():
+                continue
+            if not line.endswith(b"\n"):
+                line += b"\n"
+            
+            vote = self._parse_vote_line(line)
+            if vote is not None:
+                if seen_keys is not None and "model" in vote and "username" in vote:
+                    seen_keys.add(self._vote_key(vote))
+                if not self._add_vote_to_memory(vote, store, model_stats):
+                    continue
+                vote_count += 1
+            pending.append(line)
+            
+            if len(pending) >= VOTES_WRITE_BATCH:
+                await self._run_io(self._append_lines, target_path, pending)
+                pending = []
+        if pending:
+            await self._run_io(self._append_lines, target_path, pending)
+        return vote_count, size, last_line
+
+    async def _pull_base_tail(self, revision: str) -> bool:
+        """Merge only the votes appended to the base file since the last sync
+        
+        The range request starts at the last merged line, which must come back
+        unchanged for the file to count as appended to rather than rewritten.
+        
+        Returns:
+            bool: True if the tail was merged, False if the base file needs a full rebuild
+        """
+        if self._base_size is None or not self._base_tail:
+            return False
+        
+        tail = self._base_tail.encode()
+        url = f"https://huggingface.co/datasets/{VOTES_REPO}/resolve/{revision}/{VOTES_BASE_FILE}"
+        headers = {"Range": f"bytes={self._base_size - len(tail)}-"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, headers=headers) as response:
+                if response.status != 206:
+                    return False
+                try:
+                    overlap = await response.content.readexactly(len(tail))
+                except asyncio.IncompleteReadError:
+                    return False
+                if overlap != tail:
+                    return False
+                vote_count, size, last_line = await self._ingest_votes(
+                    response.content, self.votes_file, self._store, self._model_stats
+                )
+        
+        # A new ETag without new bytes means the file was rewritten in place
+        if not size:
+            return False
+        
+        self._base_size += size
+        if last_line:
+            self._base_tail = last_line.decode()
+        logger.info(LogFormatter.info(f"Merged {vote_count} votes appended to the base votes file"))
+        return True
+
+    async def _list_remote_shards(self, revision: str = "main") -> List[str]:
+        """List the vote shard files of the HF hub votes dataset, without listing the rest of the repo"""
+        def list_shards() -> List[str]:
+            try:
+                entries = self.hf_api.list_repo_tree(
+                    repo_id=VOTES_REPO,
+                    path_in_repo=VOTES_SHARDS_DIR,
+                    recursive=True,
+                    repo_type="dataset",
+                    revision=revision,
+                    token=self.token
+                )
+                return [entry.path for entry in entries]
+            except EntryNotFoundError:
+                return []
+        
+        files = await asyncio.to_thread(list_shards)
+        return sorted(f for f in files if f.endswith(".jsonl"))
+
+    async def _pull_remote_votes(self) -> bool:
+        """Merge remote votes missing from the local votes file and memory
+        
+        Nothing is downloaded while the dataset commit sha is unchanged. When
+        the base file ETag changed, only the bytes appended to it are fetched;
+        if it was rewritten instead, the votes are rebuilt into a fresh store
+        that replaces the current one once complete. Shards already merged are
+        skipped.
+        
+        Returns:
+            bool: True if any votes changed
+        """
+        remote_state = await self._get_remote_state()
+        if remote_state is None:
+            return False
+        
+        revision, base_etag = remote_state
+        if revision == self._remote_revision:
+            return False
+        
+        logger.info(LogFormatter.info(f"Votes dataset moved: {self._remote_revision} -> {revision}"))
+        
+        # Legacy base file, only rewritten by shard compaction; a None ETag means there is none
+        base_changed = base_etag != self._base_etag
+        rebuild = base_changed and not await self._pull_base_tail(revision)
+        if base_changed and not rebuild:
+            self._base_etag = base_etag
+        if rebuild:
+            logger.info("Base votes file changed, rebuilding local votes")
+            store, model_stats, synced_shards = VoteStore(), {}, set()
+            target_path = self.votes_file.with_suffix(".jsonl.tmp")
+        else:
+            store, model_stats, synced_shards = self._store, self._model_stats, self._synced_shards
+            target_path = self.votes_file
+        
+        remote_shards = await self._list_remote_shards(revision)
+        new_shards = [shard for shard in remote_shards if shard not in synced_shards]
+        # Shards folded into the base file are gone; uploads share the sync lock, so none is missed
+        synced_shards.intersection_update(remote_shards)
+        
+        # All writes go through the I/O thread, so these appends stay ordered with add_vote's
+        if rebuild:
+            await self._run_io(target_path.write_bytes, b"")
+            base_size, base_tail = None, b""
+            if base_etag is not None:
+                _, base_size, base_tail = await self._stream_remote_votes(
+                    VOTES_BASE_FILE, revision, target_path, store, model_stats
+                )
+        
+        # Append-only shards, each downloaded once
+        shard_keys: Set[Tuple[str, str, str, str]] = set()
+        for shard in new_shards:
+            await self._stream_remote_votes(shard, revision, target_path, store, model_stats, shard_keys)
+            synced_shards.add(shard)
+        
+        # Pending votes already on the hub, e.g. uploaded right before a crash, are not sent again
+        await self._drop_uploaded_pending_votes(shard_keys)
+        
+        if rebuild:
+            # Hold off new votes so none land in the old file or store while swapping
+            async with self._write_lock:
+                pending = [(json.dumps(vote) + "\n").encode() for vote in self.votes_to_upload]
+                for vote in self.votes_to_upload:
+                    self._add_vote_to_memory(vote, store, model_stats)
+                await self._run_io(self._append_lines, target_path, pending, fsync=True)
+                await self._run_io(os.replace, target_path, self.votes_file)
+                self._store, self._model_stats = store, model_stats
+                self._synced_shards = synced_shards
+                self._base_etag = base_etag
+                self._base_size = base_size
+                self._base_tail = base_tail.decode() if base_tail else None
+        
+        if new_shards:
+            logger.info(LogFormatter.info(f"Merged {len(new_shards)} new vote shards"))
+        
+        self._remote_revision = revision
+        self._remote_shards = remote_shards
+        await self._save_votes_state()
+        self._update_vote_summary()
+        return base_changed or bool(new_shards)
+
+    async def _copy_remote_file(self, path_in_repo: str, revision: str, target_path: Path) -> Tuple[int, bytes]:
+        """Append a file of the HF hub votes dataset to a local file, line by line
+        
+        Returns:
+            Tuple[int, bytes]: Bytes written and last line
+        """
+        url = f"https://huggingface.co/datasets/{VOTES_REPO}/resolve/{revision}/{path_in_repo}"
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        
+        size = 0
+        last_line = b""
+        pending: List[bytes] = []
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    raise Exception(f"Failed to get {path_in_repo}: HTTP {response.status}")
+                async for line in response.content:
+                    # The next file must start on its own line
+                    if not line.endswith(b"\n"):
+                        line += b"\n"
+                    size += len(line)
+                    last_line = line
+                    pending.append(line)
+                    if len(pending) >= VOTES_WRITE_BATCH:
+                        await self._run_io(self._append_lines, target_path, pending)
+                        pending = []
+        if pending:
+            await self._run_io(self._append_lines, target_path, pending)
+        return size, last_line
+
+    async def _compact_shards(self):
+        """Fold the synced shards into the base file so cold starts download a bounded number of files
+        
+        The new base file is the current one with the shards appended, so other
+        workers merge it as an appended tail and skip the votes they already
+        have. The commit is based on the synced revision and fails if another
+        worker moved the dataset in the meantime.
+        """
+        revision = self._remote_revision
+        shards = list(self._remote_shards)
+        if revision is None or len(shards) < VOTES_COMPACTION_SHARDS:
+            return
+        
+        logger.info(LogFormatter.info(f"Compacting {len(shards)} vote shards into {VOTES_BASE_FILE}..."))
+        temp_path = await self._run_io(self._write_temp_votes, [])
+        try:
+            base_size, base_tail = 0, b""
+            if self._base_etag is not None:
+                base_size, base_tail = await self._copy_remote_file(VOTES_BASE_FILE, revision, Path(temp_path))
+            for shard in shards:
+                size, last_line = await self._copy_remote_file(shard, revision, Path(temp_path))
+                base_size += size
+                base_tail = last_line or base_tail
+            
+            operations = [CommitOperationAdd(path_in_repo=VOTES_BASE_FILE, path_or_fileobj=temp_path)]
+            operations.extend(CommitOperationDelete(path_in_repo=shard) for shard in shards)
+            commit_info = await asyncio.to_thread(
+                self.hf_api.create_commit,
+                repo_id=VOTES_REPO,
+                repo_type="dataset",
+                operations=operations,
+                commit_message=f"Compact {len(shards)} vote shards into {VOTES_BASE_FILE}",
+                parent_commit=revision,
+                token=self.token
+            )
+        finally:
+            await self._run_io(os.unlink, temp_path)
+        
+        # Every compacted vote is already local, only the state moves to the new commit
+        remote_state = await self._get_remote_state(commit_info.oid)
+        self._remote_revision = commit_info.oid
+        self._remote_shards = []
+        self._synced_shards.difference_update(shards)
+        if remote_state is not None:
+            self._base_etag = remote_state[1]
+            self._base_size = base_size
+            self._base_tail = base_tail.decode() if base_tail else None
+        await self._save_votes_state()
+        logger.info(LogFormatter.success(f"Compacted {len(shards)} vote shards"))
 
     async def _check_for_new_votes(self):
         """Check for new votes on the hub and sync if needed"""
         try:
-            remote_votes = await self._fetch_remote_votes()
-            if len(remote_votes) != self._total_votes:
-                logger.info(f"Vote count changed: Local ({self._total_votes}) ≠ Remote ({len(remote_votes)})")
-                # Save to local file
-                with open(self.votes_file, 'w') as f:
-                    for vote in remote_votes:
-                        json.dump(vote, f)
-                        f.write('\n')
+            async with self._sync_lock:
+                if not await self._pull_remote_votes():
+                    logger.info("Votes are in sync")
+                self._last_sync = datetime.now(timezone.utc)
                 
-                # Reload into memory
-                await self._load_existing_votes()
-            else:
-                logger.info("Votes are in sync")
+                try:
+                    await self._compact_shards()
+                except Exception as e:
+                    # Usually another worker compacted or uploaded first
+                    logger.warning(LogFormatter.warning(f"Vote shard compaction skipped: {str(e)}"))
                 
         except Exception as e:
             logger.error(f"Error checking for new votes: {str(e)}")
 
+    def _start_background_sync(self):
+        """Start the periodic vote sync task if it is not running"""
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._sync_loop())
+
+    async def _sync_loop(self):
+        """Periodically merge votes uploaded by other workers"""
+        while True:
+            await asyncio.sleep(self._sync_interval)
+            await self._check_for_new_votes()
+
+    async def _upload_pending_votes(self):
+        """Upload pending votes to the hub as a new append-only shard"""
+        # Votes added while the upload runs stay queued for the next batch
+        batch = list(self.votes_to_upload)
+        now = datetime.now(timezone.utc)
+        shard = f"{VOTES_SHARDS_DIR}/{now.strftime('%Y-%m-%d')}/{now.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}.jsonl"
+        logger.info(LogFormatter.info(f"Uploading {len(batch)} pending votes to {shard}..."))
+        
+        # Create temporary file with only the new votes
+        temp_path = await self._run_io(self._write_temp_votes, batch)
+        
+        try:
+            await asyncio.to_thread(
+                self.hf_api.upload_file,
+                path_or_fileobj=temp_path,
+                path_in_repo=shard,
+                repo_id=VOTES_REPO,
+                repo_type="dataset",
+                commit_message=f"Add votes shard: +{len(batch)} new votes",
+                token=self.token
+            )
+        finally:
+            # Clean up temp file
+            await self._run_io(os.unlink, temp_path)
+        
+        # Clear pending votes only if upload succeeded, before recording the shard:
+        # if the process dies in between, the shard is downloaded again and its
+        # votes skipped as already known, instead of being uploaded twice
+        async with self._write_lock:
+            del self.votes_to_upload[:len(batch)]
+            await self._write_pending_votes()
+        
+        # These votes are already in the local file, so the shard never needs downloading
+        self._synced_shards.add(shard)
+        await self._save_votes_state()
+        logger.info(LogFormatter.success("Pending votes uploaded successfully"))
+
+    async def _write_pending_votes(self):
+        """Rewrite the pending votes log from votes_to_upload, under the write lock"""
+        lines = [(json.dumps(vote) + "\n").encode() for vote in self.votes_to_upload]
+        await self._run_io(self._write_lines_atomic, self.votes_pending_file, lines)
+
+    async def _load_pending_votes(self):
+        """Replay the pending votes log into the upload queue and memory"""
+        if not self.votes_pending_file.exists():
+            return
+        
+        f = await self._run_io(open, self.votes_pending_file, "rb")
+        try:
+            lines = await self._run_io(f.readlines)
+        finally:
+            await self._run_io(f.close)
+        
+        queued = {self._vote_key(vote) for vote in self.votes_to_upload}
+        missing: List[bytes] = []
+        for line in lines:
+            if not line.strip():
+                continue
+            vote = self._parse_vote_line(line)
+            if vote is None or self._vote_key(vote) in queued:
+                continue
+            queued.add(self._vote_key(vote))
+            # Votes logged as pending right before a crash may not have reached the votes log
+            if self._add_vote_to_memory(vote):
+                missing.append(line if line.endswith(b"\n") else line + b"\n")
+            self.votes_to_upload.append(vote)
+        
+        if missing:
+            await self._run_io(self._append_lines, self.votes_file, missing, fsync=True)
+        
+        if self.votes_to_upload:
+            self._update_vote_summary()
+            logger.info(LogFormatter.info(f"Recovered {len(self.votes_to_upload)} pending votes"))
+
+    async def _drop_uploaded_pending_votes(self, uploaded_keys: Set[Tuple[str, str, str, str]]):
+        """Remove pending votes whose check tuple is already on the hub"""
+        if not uploaded_keys or not self.votes_to_upload:
+            return
+        async with self._write_lock:
+            remaining = [vote for vote in self.votes_to_upload if self._vote_key(vote) not in uploaded_keys]
+            if len(remaining) == len(self.votes_to_upload):
+                return
+            logger.info(LogFormatter.info(f"Dropping {len(self.votes_to_upload) - len(remaining)} pending votes already on the hub"))
+            self.votes_to_upload[:] = remaining
+            await self._write_pending_votes()
+
+    @staticmethod
+    def _vote_key(vote: Dict[str, Any]) -> Tuple[str, str, str, str]:
+        """Check tuple identifying a vote, as used by add_vote's duplicate check"""
+        return (vote["model"], vote.get("revision", "main"), vote["username"], vote.get("precision", "unknown"))
+
+    @staticmethod
+    def _write_temp_votes(votes: List[Dict[str, Any]]) -> str:
+        """Write votes to a temporary JSONL file and return its path"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as temp_file:
+            for vote in votes:
+                json.dump(vote, temp_file)
+                temp_file.write('\n')
+            return temp_file.name
+
     async def _sync_with_hub(self):
         """Sync votes with HuggingFace hub"""
         try:
             logger.info(LogFormatter.section("VOTE SYNC"))
             
-            # Get current remote votes
-            remote_votes = await self._fetch_remote_votes()
-            logger.info(LogFormatter.info(f"Loaded {len(remote_votes)} votes from hub"))
-            
-            # If we have pending votes to upload
-            if self.votes_to_upload:
-                logger.info(LogFormatter.info(f"Adding {len(self.votes_to_upload)} pending votes..."))
-                
-                # Add new votes to remote votes
-                remote_votes.extend(self.votes_to_upload)
-                
-                # Create temporary file with all votes
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as temp_file:
-                    for vote in remote_votes:
-                        json.dump(vote, temp_file)
-                        temp_file.write('\n')
-                    temp_path = temp_file.name
+            async with self._sync_lock:
+                # If we have pending votes to upload
+                if self.votes_to_upload:
+                    try:
+                        await self._upload_pending_votes()
+                    except Exception as e:
+                        logger.error(LogFormatter.error("Failed to upload votes to hub", e))
+                        raise
                 
-                try:
-                    # Upload JSONL file directly
-                    self.hf_api.upload_file(
-                        path_or_fileobj=temp_path,
-                        path_in_repo="votes_data.jsonl",
-                        repo_id=f"{HF_ORGANIZATION}/votes",
-                        repo_type="dataset",
-                        commit_message=f"Update votes: +{len(self.votes_to_upload)} new votes",
-                        token=self.token
-                    )
-                    
-                    # Clear pending votes only if upload succeeded
-                    self.votes_to_upload.clear()
-                    logger.info(LogFormatter.success("Pending votes uploaded successfully"))
-                    
-                except Exception as e:
-                    logger.error(LogFormatter.error("Failed to upload votes to hub", e))
-                    raise
-                finally:
-                    # Clean up temp file
-                    os.unlink(temp_path)
-            
-            # Update local state
-            with open(self.votes_file, 'w') as f:
-                for vote in remote_votes:
-                    json.dump(vote, f)
-                    f.write('\n')
-            
-            # Reload votes in memory
-            await self._load_existing_votes()
-            logger.info(LogFormatter.success("Sync completed successfully"))
+                # Merge votes other workers uploaded in the meantime
+                await self._pull_remote_votes()
+                logger.info(LogFormatter.success("Sync completed successfully"))
 
-            self._last_sync = datetime.now(timezone.utc)
+                self._last_sync = datetime.now(timezone.utc)
             
         except Exception as e:
             logger.error(LogFormatter.error("Sync failed", e))
             raise
 
+    def _schedule_flush(self):
+        """Wake the background flusher, starting it if needed"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_event = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        self._flush_event.set()
+
+    async def _flush_loop(self):
+        """Upload pending votes in batches, retrying with exponential backoff"""
+        loop = asyncio.get_running_loop()
+        failures = 0
+        while True:
+            await self._flush_event.wait()
+            
+            # Keep the batch open for the flush interval unless it fills up first
+            deadline = loop.time() + self._flush_interval
+            while len(self.votes_to_upload) < self._flush_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                self._flush_event.clear()
+                try:
+                    await asyncio.wait_for(self._flush_event.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+            self._flush_event.clear()
+            
+            if not self.votes_to_upload:
+                continue
+            
+            try:
+                await self._sync_with_hub()
+                failures = 0
+            except Exception as e:
+                failures += 1
+                backoff = min(self._retry_delay * 2 ** failures, self._flush_max_backoff)
+                logger.error(LogFormatter.error(f"Vote flush failed (attempt {failures}), retrying in {backoff}s", e))
+                await asyncio.sleep(backoff)
+            
+            # Votes that arrived during the upload, or a failed batch, need another pass
+            if self.votes_to_upload:
+                self._flush_event.set()
+
+    async def close(self):
+        """Stop the background tasks and upload whatever is still pending"""
+        for task in (self._init_task, self._sync_task, self._flush_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                except Exception as e:
+                    logger.error(LogFormatter.error("Background vote task failed", e))
+        self._init_task = None
+        self._sync_task = None
+        self._flush_task = None
+        
+        if self.votes_to_upload:
+            try:
+                await self._sync_with_hub()
+            except Exception as e:
+                logger.error(LogFormatter.error(f"Failed to flush {len(self.votes_to_upload)} pending votes on shutdown", e))
+
+    def _parse_vote_line(self, line: bytes) -> Optional[Dict[str, Any]]:
+        """Parse one line of a votes file"""
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError as e:
+            logger.error(LogFormatter.error("Vote parsing failed", e))
+            return None
+
+    def _update_vote_summary(self):
+        """Refresh the vote totals derived from the in-memory indexes"""
+        self._total_votes = len(self._store)
+        self._last_vote_timestamp = self._store.latest_timestamp
+
     async def _load_existing_votes(self):
         """Load existing votes from file"""
         if not self.votes_file.exists():
@@ -203,50 +795,32 @@ class VoteService(HuggingFaceService):
             logger.info(LogFormatter.section("LOADING VOTES"))
             
             # Clear existing data structures
-            self.vote_check_set.clear()
-            self._votes_by_model.clear()
-            self._votes_by_user.clear()
+            self._store.clear()
+            self._model_stats.clear()
             
-            vote_count = 0
-            latest_timestamp = None
-            
-            with open(self.votes_file, "r") as f:
-                for line in f:
-                    try:
-                        vote = json.loads(line.strip())
-                        vote_count += 1
-                        
-                        # Track latest timestamp
-                        try:
-                            vote_timestamp = datetime.fromisoformat(vote["timestamp"].replace("Z", "+00:00"))
-                            if not latest_timestamp or vote_timestamp > latest_timestamp:
-                                latest_timestamp = vote_timestamp
-                            vote["timestamp"] = vote_timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
-                        except (KeyError, ValueError) as e:
-                            logger.warning(LogFormatter.warning(f"Invalid timestamp in vote: {str(e)}"))
+            f = await self._run_io(open, self.votes_file, "rb")
+            try:
+                while True:
+                    lines = await self._run_io(f.readlines, 1 << 20)
+                    if not lines:
+                        break
+                    for line in lines:
+                        if not line.strip():
                             continue
-                        
-                        if vote_count % 1000 == 0:
-                            logger.info(LogFormatter.info(f"Processed {vote_count:,} votes..."))
-                        
-                        self._add_vote_to_memory(vote)
-                        
-                    except json.JSONDecodeError as e:
-                        logger.error(LogFormatter.error("Vote parsing failed", e))
-                        continue
-                    except Exception as e:
-                        logger.error(LogFormatter.error("Vote processing failed", e))
-                        continue
+                        vote = self._parse_vote_line(line)
+                        if vote is not None:
+                            self._add_vote_to_memory(vote)
+            finally:
+                await self._run_io(f.close)
             
-            self._total_votes = vote_count
-            self._last_vote_timestamp = latest_timestamp
+            self._update_vote_summary()
             
             # Final summary
             stats = {
-                "Total_Votes": vote_count,
-                "Latest_Vote": latest_timestamp.strftime("%Y-%m-%d %H:%M:%S UTC") if latest_timestamp else "None",
-                "Unique_Models": len(self._votes_by_model),
-                "Unique_Users": len(self._votes_by_user)
+                "Total_Votes": self._total_votes,
+                "Latest_Vote": self._last_vote_timestamp.strftime("%Y-%m-%d %H:%M:%S UTC") if self._last_vote_timestamp else "None",
+                "Unique_Models": self._store.model_count,
+                "Unique_Users": self._store.user_count
             }
             
             logger.info(LogFormatter.section("VOTE SUMMARY"))
@@ -257,99 +831,242 @@ class VoteService(HuggingFaceService):
             logger.error(LogFormatter.error("Failed to load votes", e))
             raise
 
-    def _add_vote_to_memory(self, vote: Dict[str, Any]):
-        """Add vote to memory structures"""
+    def _add_vote_to_memory(
+        self,
+        vote: Dict[str, Any],
+        store: Optional[VoteStore] = None,
+        model_stats: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> bool:
+        """Add vote to memory structures, the service's own unless others are given
+        
+        Returns:
+            bool: True if the vote was added, False if it was already there or invalid
+        """
+        store = self._store if store is None else store
+        model_stats = self._model_stats if model_stats is None else model_stats
         try:
-            # Create a unique identifier tuple that includes precision
-            check_tuple = (
-                vote["model"],
-                vote.get("revision", "main"),
-                vote["username"],
-                vote.get("precision", "unknown")
-            )
-            
             # Skip if we already have this vote
-            if check_tuple in self.vote_check_set:
-                return
-                
-            self.vote_check_set.add(check_tuple)
+            if not store.add(vote):
+                return False
             
-            # Update model votes
-            if vote["model"] not in self._votes_by_model:
-                self._votes_by_model[vote["model"]] = []
-            self._votes_by_model[vote["model"]].append(vote)
-            
-            # Update user votes
-            if vote["username"] not in self._votes_by_user:
-                self._votes_by_user[vote["username"]] = []
-            self._votes_by_user[vote["username"]].append(vote)
+            self._update_model_stats(vote, model_stats)
+            return True
             
         except KeyError as e:
             logger.error(LogFormatter.error("Malformed vote data, missing key", str(e)))
+        except ValueError as e:
+            logger.warning(LogFormatter.warning(f"Invalid timestamp in vote: {str(e)}"))
         except Exception as e:
             logger.error(LogFormatter.error("Error adding vote to memory", str(e)))
+        return False
+
+    def _update_model_stats(self, vote: Dict[str, Any], model_stats: Dict[str, Dict[str, Any]]):
+        """Count a vote in its model's totals and per (revision, precision) config"""
+        stats = model_stats.get(vote["model"])
+        if stats is None:
+            stats = {"total": 0, "up": 0, "down": 0, "by_config": {}}
+            model_stats[vote["model"]] = stats
+        
+        revision = vote.get("revision", "main")
+        precision = vote.get("precision", "unknown")
+        config_key = f"{revision}_{precision}"
+        config = stats["by_config"].get(config_key)
+        if config is None:
+            config = {
+                "revision": revision,
+                "precision": precision,
+                "count": 0,
+                "up": 0,
+                "down": 0
+            }
+            stats["by_config"][config_key] = config
+        
+        stats["total"] += 1
+        config["count"] += 1
+        vote_type = vote.get("vote_type")
+        if vote_type in ("up", "down"):
+            stats[vote_type] += 1
+            config[vote_type] += 1
 
     async def get_user_votes(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all votes from a specific user"""
         logger.info(LogFormatter.info(f"Fetching votes for user: {user_id}"))
         
-        # Check if we need to refresh votes
-        if (datetime.now(timezone.utc) - self._last_sync).total_seconds() > self._sync_interval:
-            logger.info(LogFormatter.info("Cache expired, refreshing votes..."))
-            await self._check_for_new_votes()
-            
-        votes = self._votes_by_user.get(user_id, [])
+        votes = self._store.votes_for_user(user_id)
         logger.info(LogFormatter.success(f"Found {len(votes):,} votes"))
         return votes
 
-    async def get_model_votes(self, model_id: str) -> Dict[str, Any]:
-        """Get all votes for a specific model"""
-        logger.info(LogFormatter.info(f"Fetching votes for model: {model_id}"))
+    async def get_model_votes(self, model_id: str, include_votes: bool = True) -> Dict[str, Any]:
+        """Get vote totals for a specific model
         
-        # Check if we need to refresh votes
-        if (datetime.now(timezone.utc) - self._last_sync).total_seconds() > self._sync_interval:
-            logger.info(LogFormatter.info("Cache expired, refreshing votes..."))
-            await self._check_for_new_votes()
-        
-        votes = self._votes_by_model.get(model_id, [])
+        Args:
+            model_id: The model identifier (org/model-name)
+            include_votes: Whether to include the raw list of votes
+        """
+        logger.info(LogFormatter.info(f"Fetching votes for model: {model_id}"))
         
-        # Group votes by revision and precision
-        votes_by_config = {}
-        for vote in votes:
-            revision = vote.get("revision", "main")
-            precision = vote.get("precision", "unknown")
-            config_key = f"{revision}_{precision}"
-            if config_key not in votes_by_config:
-                votes_by_config[config_key] = {
-                    "revision": revision,
-                    "precision": precision,
-                    "count": 0
-                }
-            votes_by_config[config_key]["count"] += 1
+        stats = self._model_stats.get(model_id, {"total": 0, "up": 0, "down": 0, "by_config": {}})
+        votes_by_config = {key: dict(config) for key, config in stats["by_config"].items()}
         
-        stats = {
-            "Total_Votes": len(votes),
+        log_stats = {
+            "Total_Votes": stats["total"],
             **{f"Config_{k}": v["count"] for k, v in votes_by_config.items()}
         }
         
         logger.info(LogFormatter.section("VOTE STATISTICS"))
-        for line in LogFormatter.stats(stats):
+        for line in LogFormatter.stats(log_stats):
             logger.info(line)
         
-        return {
-            "total_votes": len(votes),
-            "votes_by_config": votes_by_config,
-            "votes": votes
+        result = {
+            "total_votes": stats["total"],
+            "up_votes": stats["up"],
+            "down_votes": stats["down"],
+            "votes_by_config": votes_by_config
         }
+        if include_votes:
+            result["votes"] = self._store.votes_for_model(model_id)
+        return result
+
+    def _parse_page_args(
+        self,
+        limit: int,
+        since: Optional[str],
+        until: Optional[str]
+    ) -> Tuple[int, Optional[int], Optional[int]]:
+        """Validate page arguments and convert the time window to epoch seconds"""
+        if limit < 1 or limit > VOTES_PAGE_MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {VOTES_PAGE_MAX_LIMIT}")
+        since_ts = VoteStore.parse_timestamp(since) if since else None
+        until_ts = VoteStore.parse_timestamp(until) if until else None
+        return limit, since_ts, until_ts
+
+    async def get_user_votes_page(
+        self,
+        user_id: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get a page of a user's votes, newest first
+        
+        Args:
+            user_id: The HuggingFace username
+            limit: Maximum number of votes in the page
+            cursor: next_cursor of the previous page
+            since: Only votes at or after this ISO timestamp
+            until: Only votes before this ISO timestamp
+        """
+        limit, since_ts, until_ts = self._parse_page_args(limit, since, until)
+        votes, next_cursor = self._store.user_votes_page(user_id, limit, cursor, since_ts, until_ts)
+        return {"votes": votes, "next_cursor": next_cursor}
+
+    async def get_model_votes_page(
+        self,
+        model_id: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get a page of a model's votes, newest first
+        
+        Args:
+            model_id: The model identifier (org/model-name)
+            limit: Maximum number of votes in the page
+            cursor: next_cursor of the previous page
+            since: Only votes at or after this ISO timestamp
+            until: Only votes before this ISO timestamp
+        """
+        limit, since_ts, until_ts = self._parse_page_args(limit, since, until)
+        votes, next_cursor = self._store.model_votes_page(model_id, limit, cursor, since_ts, until_ts)
+        return {"votes": votes, "next_cursor": next_cursor}
+
+    async def get_votes_summary(self, model_ids: List[str], user_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Get vote totals for several models, and whether a user voted on each
+        
+        Args:
+            model_ids: The model identifiers (org/model-name)
+            user_id: HuggingFace username whose votes are flagged, if any
+        """
+        if len(model_ids) > SUMMARY_MAX_MODELS:
+            raise ValueError(f"At most {SUMMARY_MAX_MODELS} models can be summarized at once")
+        
+        voted = self._store.models_voted_by(user_id) if user_id else set()
+        summary = {}
+        for model_id in model_ids:
+            stats = self._model_stats.get(model_id)
+            summary[model_id] = {
+                "total_votes": stats["total"] if stats else 0,
+                "up_votes": stats["up"] if stats else 0,
+                "down_votes": stats["down"] if stats else 0
+            }
+            if user_id:
+                summary[model_id]["has_voted"] = model_id in voted
+        return summary
+
+    def _parse_window(self, window: str) -> int:
+        """Convert a window such as '24h' or '7d' to seconds"""
+        units = {"h": 3600, "d": 86400}
+        if len(window) < 2 or window[-1] not in units or not window[:-1].isdigit():
+            raise ValueError(f"Invalid window '{window}', expected e.g. '24h' or '7d'")
+        seconds = int(window[:-1]) * units[window[-1]]
+        if seconds <= 0 or seconds > TRENDING_MAX_WINDOW:
+            raise ValueError("window must be between 1h and 30d")
+        return seconds
+
+    async def get_trending_models(self, window: str = "24h", limit: int = 10) -> List[Dict[str, Any]]:
+        """Get the models with the most up votes over a recent window
+        
+        Down votes are not counted. Counts come from hourly buckets, so the
+        window starts on the hour.
+        """
+        if limit < 1 or limit > TRENDING_MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {TRENDING_MAX_LIMIT}")
+        now = int(datetime.now(timezone.utc).timestamp())
+        top = self._store.top_models(now - self._parse_window(window), now + 1, limit)
+        return [{"model": model, "votes": count} for model, count in top]
+
+    async def _get_model_config(self, model_id: str) -> Tuple[str, str]:
+        """Get the (sha, card precision) of a model
+        
+        Results are cached for MODEL_INFO_CACHE_TTL seconds, and concurrent
+        lookups of the same model share a single hub call.
+        """
+        now = asyncio.get_running_loop().time()
+        cached = self._model_info_cache.get(model_id)
+        if cached is not None and cached[0] > now:
+            self._model_info_cache.move_to_end(model_id)
+            return cached[1]
+        
+        task = self._model_info_pending.get(model_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch_model_config(model_id))
+            self._model_info_pending[model_id] = task
+            task.add_done_callback(lambda _: self._model_info_pending.pop(model_id, None))
+        # A cancelled caller must not cancel the lookup the others are waiting on
+        return await asyncio.shield(task)
+
+    async def _fetch_model_config(self, model_id: str) -> Tuple[str, str]:
+        """Fetch the (sha, card precision) of a model from the hub and cache it"""
+        model_info = await asyncio.to_thread(self.hf_api.model_info, model_id)
+        model_card_data = model_info.cardData if getattr(model_info, 'cardData', None) else {}
+        config = (model_info.sha, model_card_data.get("precision", "unknown"))
+        
+        self._model_info_cache[model_id] = (asyncio.get_running_loop().time() + MODEL_INFO_CACHE_TTL, config)
+        self._model_info_cache.move_to_end(model_id)
+        while len(self._model_info_cache) > MODEL_INFO_CACHE_SIZE:
+            self._model_info_cache.popitem(last=False)
+        return config
 
     async def _get_model_revision(self, model_id: str) -> str:
         """Get current revision of a model with retries"""
         logger.info(f"Getting revision for model: {model_id}")
         for attempt in range(self._max_retries):
             try:
-                model_info = await asyncio.to_thread(self.hf_api.model_info, model_id)
-                logger.info(f"Successfully got revision {model_info.sha} for model {model_id}")
-                return model_info.sha
+                revision, _ = await self._get_model_config(model_id)
+                logger.info(f"Successfully got revision {revision} for model {model_id}")
+                return revision
             except Exception as e:
                 logger.error(f"Error getting model revision for {model_id} (attempt {attempt + 1}): {str(e)}")
                 if attempt < self._max_retries - 1:
@@ -385,39 +1102,42 @@ class VoteService(HuggingFaceService):
             # If any info is missing, try to get it from model info
             if not all([precision, revision]):
                 try:
-                    model_info = await asyncio.to_thread(self.hf_api.model_info, model_id)
-                    model_card_data = model_info.cardData if hasattr(model_info, 'cardData') else {}
+                    model_sha, model_precision = await self._get_model_config(model_id)
                     
                     if not precision:
-                        precision = model_card_data.get("precision", "unknown")
+                        precision = model_precision
                     if not revision:
-                        revision = model_info.sha
+                        revision = model_sha
                 except Exception as e:
                     logger.warning(LogFormatter.warning(f"Failed to get model info: {str(e)}. Using default values."))
                     precision = precision or "unknown"
                     revision = revision or "main"
             
-            # Check if vote already exists with this configuration
-            check_tuple = (model_id, revision, user_id, precision)
-            
-            if check_tuple in self.vote_check_set:
-                raise ValueError(f"Vote already recorded for this model configuration (precision: {precision}, revision: {revision[:7] if revision else 'unknown'})")
+            # The write lock keeps the check, the write and the indexing together
+            async with self._write_lock:
+                # Check if vote already exists with this configuration
+                if self._store.contains(model_id, revision, user_id, precision):
+                    raise ValueError(f"Vote already recorded for this model configuration (precision: {precision}, revision: {revision[:7] if revision else 'unknown'})")
 
-            vote = {
-                "model": model_id,
-                "revision": revision,
-                "username": user_id,
-                "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "vote_type": vote_type,
-                "precision": precision
-            }
+                vote = {
+                    "model": model_id,
+                    "revision": revision,
+                    "username": user_id,
+                    "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "vote_type": vote_type,
+                    "precision": precision
+                }
 
-            # Update local storage
-            with open(self.votes_file, "a") as f:
-                f.write(json.dumps(vote) + "\n")
-            
-            self._add_vote_to_memory(vote)
-            self.votes_to_upload.append(vote)
+                # Update local storage and the pending log, durably, before acknowledging the vote
+                await self._run_io(
+                    self._append_vote_lines,
+                    self.votes_file,
+                    self.votes_pending_file,
+                    (json.dumps(vote) + "\n").encode()
+                )
+                
+                self._add_vote_to_memory(vote)
+                self.votes_to_upload.append(vote)
             
             stats = {
                 "Status": "Success",
@@ -430,9 +1150,8 @@ class VoteService(HuggingFaceService):
             for line in LogFormatter.stats(stats):
                 logger.info(line)
             
-            # Force immediate sync
-            logger.info(LogFormatter.info("Forcing immediate sync with hub"))
-            await self._sync_with_hub()
+            # Upload in the background with the next batch
+            self._schedule_flush()
             
             return {"status": "success", "message": "Vote added successfully"}
             
@@ -1,3 +1,4 @@
 from . import model_validation
+from . import safetensors_sizing
 
-__all__ = ["model_validation"]
+__all__ = ["model_validation", "safetensors_sizing"]
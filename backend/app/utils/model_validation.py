@@ -1,22 +1,39 @@
 import json
+import os
 import logging
 import asyncio
-from typing import Tuple, Optional, Dict, Any
-from datasets import load_dataset
+import tempfile
+from typing import Tuple, Optional, Dict, Any, Set, FrozenSet
 from huggingface_hub import HfApi, ModelCard, hf_hub_download
 from huggingface_hub import hf_api
-from transformers import AutoConfig, AutoTokenizer
-from app.config.base import HF_TOKEN
+from huggingface_hub.utils import EntryNotFoundError, GatedRepoError
+from app.config.base import HF_TOKEN, STRICT_MODEL_VALIDATION
 from app.config.hf_config import OFFICIAL_PROVIDERS_REPO
+from app.core.cache import cache_config
 from app.core.formatting import LogFormatter
+from app.utils.safetensors_sizing import SafetensorsSizer
 
 logger = logging.getLogger(__name__)
 
+# Seconds between checks of the official providers dataset for a new revision
+OFFICIAL_PROVIDERS_REFRESH_INTERVAL = 600
+
+REMOTE_CODE_ERROR = "The model requires `trust_remote_code=True` to launch, and for safety reasons, we don't accept such models automatically."
+
 class ModelValidator:
+    # Curated official provider organizations, shared by all validators
+    _official_providers: Optional[FrozenSet[str]] = None
+    _official_providers_sha: Optional[str] = None
+    _official_providers_lock: Optional[asyncio.Lock] = None
+    _official_providers_task: Optional[asyncio.Task] = None
+    # "base_model@sha" -> parameter count, persisted across restarts
+    _base_model_sizes: Optional[Dict[str, int]] = None
+
     def __init__(self):
         self.token = HF_TOKEN
         self.api = HfApi(token=self.token)
         self.headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        self.sizer = SafetensorsSizer(token=self.token)
         
     async def check_model_card(self, model_id: str) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
         """Check if model has a valid model card"""
@@ -79,6 +96,62 @@ class ModelValidator:
             logger.error(f"Failed to get safetensors metadata: {str(e)}")
             return None
 
+    def _load_base_model_sizes(self) -> Dict[str, int]:
+        """Load the persisted base model parameter counts"""
+        if ModelValidator._base_model_sizes is None:
+            try:
+                with open(cache_config.model_sizes_file, 'r') as f:
+                    ModelValidator._base_model_sizes = json.load(f)
+            except FileNotFoundError:
+                ModelValidator._base_model_sizes = {}
+            except Exception as e:
+                logger.warning(LogFormatter.warning(f"Ignoring invalid model sizes cache: {str(e)}"))
+                ModelValidator._base_model_sizes = {}
+        return ModelValidator._base_model_sizes
+
+    @staticmethod
+    def _write_base_model_sizes(sizes: Dict[str, int]):
+        """Persist base model parameter counts atomically"""
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode='w',
+                dir=cache_config.model_sizes_file.parent,
+                suffix='.tmp',
+                delete=False
+            ) as temp_file:
+                json.dump(sizes, temp_file)
+                temp_path = temp_file.name
+            os.replace(temp_path, cache_config.model_sizes_file)
+        except Exception as e:
+            logger.warning(LogFormatter.warning(f"Failed to persist model sizes cache: {str(e)}"))
+
+    async def _get_base_model_size(self, base_model: str) -> Optional[int]:
+        """Get the parameter count of a base model at the current sha of its main branch
+        
+        Counts are cached per sha, so a new commit on main is sized again.
+        """
+        try:
+            base_info = await asyncio.to_thread(self.api.model_info, base_model, revision="main")
+        except Exception as e:
+            logger.error(f"Failed to resolve base model {base_model}: {str(e)}")
+            return None
+        
+        key = f"{base_model}@{base_info.sha}"
+        sizes = await asyncio.to_thread(self._load_base_model_sizes)
+        if key in sizes:
+            return sizes[key]
+        
+        base_meta = await self.get_safetensors_metadata(base_model, revision=base_info.sha)
+        if not base_meta:
+            return None
+        
+        # Older shas of the same base model are never looked up again
+        for stale_key in [k for k in sizes if k.rsplit("@", 1)[0] == base_model]:
+            del sizes[stale_key]
+        sizes[key] = sum(base_meta.parameter_count.values())
+        await asyncio.to_thread(self._write_base_model_sizes, dict(sizes))
+        return sizes[key]
+
     async def get_model_size(
         self,
         model_info: Any,
@@ -98,18 +171,21 @@ class ModelValidator:
 
             if is_adapter and base_model:
                 # For adapters, we need both adapter and base model sizes
-                adapter_meta = await self.get_safetensors_metadata(model_info.id, is_adapter=True, revision=revision)
-                base_meta = await self.get_safetensors_metadata(base_model, revision="main")
+                adapter_meta, base_size = await asyncio.gather(
+                    self.get_safetensors_metadata(model_info.id, is_adapter=True, revision=revision),
+                    self._get_base_model_size(base_model)
+                )
 
-                if adapter_meta and base_meta:
+                if adapter_meta and base_size is not None:
                     adapter_size = sum(adapter_meta.parameter_count.values())
-                    base_size = sum(base_meta.parameter_count.values())
                     model_size = adapter_size + base_size
             else:
-                # For regular models, just get the model size
-                meta = await self.get_safetensors_metadata(model_info.id, revision=revision)
-                if meta:
-                    model_size = sum(meta.parameter_count.values()) # total params
+                # For regular models, read the shard headers directly, falling back to the hub helper
+                model_size = await self.sizer.get_parameter_count(model_info.id, revision)
+                if model_size is None:
+                    meta = await self.get_safetensors_metadata(model_info.id, revision=revision)
+                    if meta:
+                        model_size = sum(meta.parameter_count.values()) # total params
 
             if model_size is None:
                 # If model size could not be determined, return an error
@@ -172,9 +248,24 @@ class ModelValidator:
         model_name: str,
         revision: str,
         test_tokenizer: bool = False,
-        trust_remote_code: bool = False
+        trust_remote_code: bool = False,
+        strict: Optional[bool] = None
     ) -> Tuple[bool, Optional[str], Optional[Any]]:
-        """Check if model exists and is properly configured on the Hub"""
+        """Check if model exists and is properly configured on the Hub
+        
+        By default only config.json and tokenizer_config.json are fetched and
+        checked against the classes of the installed Transformers. Strict mode,
+        on by default when STRICT_MODEL_VALIDATION is set, instantiates the
+        config and tokenizer instead.
+        """
+        if strict is None:
+            strict = STRICT_MODEL_VALIDATION
+        if not strict:
+            return await self._check_model_metadata(model_name, revision, test_tokenizer, trust_remote_code)
+        
+        # Imported on first use, as Transformers is slow to import and only needed for submissions
+        from transformers import AutoConfig, AutoTokenizer
+        
         try:
             config = await asyncio.to_thread(
                 AutoConfig.from_pretrained,
@@ -202,23 +293,170 @@ class ModelValidator:
             return True, None, config
             
         except ValueError:
-            return False, "The model requires `trust_remote_code=True` to launch, and for safety reasons, we don't accept such models automatically.", None
+            return False, REMOTE_CODE_ERROR, None
         except Exception as e:
             if "You are trying to access a gated repo." in str(e):
                 return True, "The model is gated and requires special access permissions.", None
             return False, f"The model was not found or is misconfigured on the Hub. Error: {e.args[0]}", None
 
+    def _download_json(self, model_name: str, filename: str, revision: str) -> Optional[Dict[str, Any]]:
+        """Download and parse a JSON file of a model repo, None if the file does not exist
+        
+        Files are served from the local hub cache when their revision is already there.
+        """
+        try:
+            path = hf_hub_download(
+                repo_id=model_name,
+                filename=filename,
+                revision=revision,
+                token=self.token
+            )
+        except EntryNotFoundError:
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _check_transformers_support(
+        config: Dict[str, Any],
+        tokenizer_config: Optional[Dict[str, Any]],
+        trust_remote_code: bool = False
+    ) -> Optional[str]:
+        """Check a model type and tokenizer class against the installed Transformers, returning an error if unsupported
+        
+        Like Transformers' resolve_trust_remote_code, an auto_map only counts as
+        remote code when no built-in class can be used instead.
+        """
+        # Imported on first use, as Transformers is slow to import and only needed for submissions
+        from transformers.models.auto.configuration_auto import CONFIG_MAPPING_NAMES
+        from transformers.models.auto.tokenization_auto import TOKENIZER_MAPPING_NAMES, tokenizer_class_from_name
+        
+        model_type = config.get("model_type")
+        config_auto_map = config.get("auto_map") or {}
+        if model_type not in CONFIG_MAPPING_NAMES:
+            if "AutoConfig" in config_auto_map:
+                return None if trust_remote_code else REMOTE_CODE_ERROR
+            return f"The model type '{model_type}' is not supported by an official Transformers release."
+        if tokenizer_config is None:
+            return None
+        
+        # Same resolution order as AutoTokenizer: explicit class first, then the model type
+        tokenizer_class = tokenizer_config.get("tokenizer_class") or config.get("tokenizer_class")
+        if tokenizer_class:
+            candidates = [tokenizer_class] if tokenizer_class.endswith("Fast") else [f"{tokenizer_class}Fast", tokenizer_class]
+            has_local_tokenizer = any(tokenizer_class_from_name(candidate) is not None for candidate in candidates)
+        else:
+            has_local_tokenizer = any(TOKENIZER_MAPPING_NAMES.get(model_type) or ())
+        
+        tokenizer_auto_map = tokenizer_config.get("auto_map")
+        if tokenizer_auto_map is None and isinstance(config_auto_map, dict):
+            tokenizer_auto_map = config_auto_map.get("AutoTokenizer")
+        if tokenizer_auto_map and not has_local_tokenizer:
+            return None if trust_remote_code else REMOTE_CODE_ERROR
+        
+        if not has_local_tokenizer:
+            if tokenizer_class:
+                return f"The tokenizer is not available in an official Transformers release: Tokenizer class {tokenizer_class} does not exist or is not currently imported."
+            return "The tokenizer cannot be loaded. Ensure the tokenizer class is part of a stable Transformers release and correctly configured."
+        return None
+
+    async def _check_model_metadata(
+        self,
+        model_name: str,
+        revision: str,
+        test_tokenizer: bool,
+        trust_remote_code: bool
+    ) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        """Check the model config and tokenizer from their JSON files alone"""
+        try:
+            config = await asyncio.to_thread(self._download_json, model_name, "config.json", revision)
+            if config is None:
+                return False, "The model was not found or is misconfigured on the Hub. Error: config.json is missing", None
+            
+            tokenizer_config = None
+            if test_tokenizer:
+                tokenizer_config = await asyncio.to_thread(
+                    self._download_json, model_name, "tokenizer_config.json", revision
+                )
+                if tokenizer_config is None:
+                    # A repo without any tokenizer files cannot load a tokenizer
+                    has_tokenizer = await asyncio.to_thread(
+                        self.api.file_exists,
+                        model_name,
+                        "tokenizer.json",
+                        revision=revision,
+                        token=self.token
+                    )
+                    if not has_tokenizer:
+                        return False, "The tokenizer cannot be loaded. Ensure the tokenizer class is part of a stable Transformers release and correctly configured.", None
+                    tokenizer_config = {}
+            
+            error = await asyncio.to_thread(
+                self._check_transformers_support, config, tokenizer_config, trust_remote_code
+            )
+            if error:
+                return False, error, None
+            
+            return True, None, config
+            
+        except GatedRepoError:
+            return True, "The model is gated and requires special access permissions.", None
+        except Exception as e:
+            return False, f"The model was not found or is misconfigured on the Hub. Error: {e}", None
+
+    async def get_official_providers(self) -> FrozenSet[str]:
+        """Get the official provider organizations, loading them on first use"""
+        cls = ModelValidator
+        if cls._official_providers is None:
+            if cls._official_providers_lock is None:
+                cls._official_providers_lock = asyncio.Lock()
+            async with cls._official_providers_lock:
+                if cls._official_providers is None:
+                    await self.refresh_official_providers()
+        
+        if cls._official_providers_task is None or cls._official_providers_task.done():
+            cls._official_providers_task = asyncio.create_task(self._refresh_official_providers_loop())
+        return cls._official_providers
+
+    async def refresh_official_providers(self) -> bool:
+        """Reload the official providers if their dataset has a new revision
+        
+        Returns:
+            bool: True if the set was reloaded
+        """
+        cls = ModelValidator
+        dataset_info = await asyncio.to_thread(self.api.dataset_info, OFFICIAL_PROVIDERS_REPO)
+        if cls._official_providers is not None and dataset_info.sha == cls._official_providers_sha:
+            return False
+        
+        # Imported on first use, as datasets is slow to import
+        from datasets import load_dataset
+        dataset = await asyncio.to_thread(load_dataset, OFFICIAL_PROVIDERS_REPO, revision=dataset_info.sha)
+        cls._official_providers = frozenset(dataset["train"][0]["CURATED_SET"])
+        cls._official_providers_sha = dataset_info.sha
+        logger.info(LogFormatter.success(f"Loaded {len(cls._official_providers)} official providers at {dataset_info.sha[:7]}"))
+        return True
+
+    async def _refresh_official_providers_loop(self):
+        """Periodically pick up new revisions of the official providers dataset"""
+        while True:
+            await asyncio.sleep(OFFICIAL_PROVIDERS_REFRESH_INTERVAL)
+            try:
+                await self.refresh_official_providers()
+            except Exception as e:
+                logger.warning(LogFormatter.warning(f"Failed to refresh official providers, keeping current set: {str(e)}"))
+
     async def check_official_provider_status(
         self, 
         model_id: str,
-        existing_models: Dict[str, list]
+        finished_model_names: Set[str]
     ) -> Tuple[bool, Optional[str]]:
         """
         Check if model is from official provider and has finished submission.
         
         Args:
             model_id: The model identifier (org/model-name)
-            existing_models: Dictionary of models by status from get_models()
+            finished_model_names: Names of the models with a finished evaluation
             
         Returns:
             Tuple[bool, Optional[str]]: (is_valid, error_message)
@@ -232,9 +470,7 @@ class ModelValidator:
             if not model_org:
                 return True, None
                 
-            # Load official providers dataset
-            dataset = load_dataset(OFFICIAL_PROVIDERS_REPO)
-            official_providers = dataset["train"][0]["CURATED_SET"]
+            official_providers = await self.get_official_providers()
             
             # Check if model org is in official providers
             is_official = model_org in official_providers
@@ -243,16 +479,14 @@ class ModelValidator:
                 logger.info(LogFormatter.info(f"Model organization '{model_org}' is an official provider"))
                 
                 # Check for finished submissions
-                if "finished" in existing_models:
-                    for model in existing_models["finished"]:
-                        if model["name"] == model_id:
-                            error_msg = (
-                                f"Model {model_id} is an official provider model "
-                                f"with a completed evaluation. "
-                                f"To re-evaluate, please open a discussion."
-                            )
-                            logger.error(LogFormatter.error("Validation failed", error_msg))
-                            return False, error_msg
+                if model_id in finished_model_names:
+                    error_msg = (
+                        f"Model {model_id} is an official provider model "
+                        f"with a completed evaluation. "
+                        f"To re-evaluate, please open a discussion."
+                    )
+                    logger.error(LogFormatter.error("Validation failed", error_msg))
+                    return False, error_msg
                 
                 logger.info(LogFormatter.success("No finished submission found for this official provider model"))
             else:
@@ -0,0 +1,170 @@
+import json
+import math
+import struct
+import logging
+import asyncio
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import aiohttp
+from app.config.base import API, HF_TOKEN, SAFETENSORS_MIRROR_DIR
+from app.core.formatting import LogFormatter
+
+logger = logging.getLogger(__name__)
+
+SAFETENSORS_INDEX_FILE = "model.safetensors.index.json"
+SAFETENSORS_SINGLE_FILE = "model.safetensors"
+HEADER_PREFIX_BYTES = 8  # little-endian u64 length of the JSON header
+HEADER_MAX_BYTES = 100 * 1024 * 1024  # limit set by the safetensors format
+HEADER_FIRST_READ = 64 * 1024  # most headers fit in the first range request
+SHARD_CONCURRENCY = 8
+
+class SafetensorsSizer:
+    """Counts model parameters from safetensors headers alone
+
+    Only the 8-byte length prefix and the JSON header of each shard are read,
+    with HTTP range requests against the hub (or any server exposing the same
+    resolve URLs) or directly from a local mirror directory laid out as
+    <org>/<model>/<revision>. Shards are read concurrently and their counts
+    cached by blob sha.
+    """
+    # blob sha -> parameter count, shared by all sizers
+    _shard_counts: Dict[str, int] = {}
+
+    def __init__(
+        self,
+        endpoint: str = API["HUB"],
+        token: Optional[str] = HF_TOKEN,
+        mirror_dir: Optional[Path] = SAFETENSORS_MIRROR_DIR,
+        concurrency: int = SHARD_CONCURRENCY
+    ):
+        self.endpoint = endpoint.rstrip("/")
+        self.headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self.mirror_dir = Path(mirror_dir) if mirror_dir else None
+        self.concurrency = concurrency
+
+    async def get_parameter_count(self, model_id: str, revision: str = "main") -> Optional[int]:
+        """Get the total parameter count of a model, None if it has no readable safetensors weights"""
+        try:
+            # Only a mirror of the exact revision is used, any other goes to the hub
+            if self.mirror_dir is not None and (self.mirror_dir / model_id / revision).is_dir():
+                return await asyncio.to_thread(self._count_local, self.mirror_dir / model_id / revision)
+            return await self._count_remote(model_id, revision)
+        except Exception as e:
+            logger.warning(LogFormatter.warning(f"Could not size {model_id} from safetensors headers: {str(e)}"))
+            return None
+
+    @staticmethod
+    def _count_header(header: Dict[str, Any]) -> int:
+        """Sum the element counts of the tensors described by a safetensors header"""
+        return sum(
+            math.prod(tensor["shape"])
+            for name, tensor in header.items()
+            if name != "__metadata__"
+        )
+
+    @staticmethod
+    def _header_length(prefix: bytes) -> int:
+        """Decode and bound the header length prefix"""
+        header_length = struct.unpack("<Q", prefix)[0]
+        if header_length > HEADER_MAX_BYTES:
+            raise ValueError(f"Safetensors header of {header_length} bytes exceeds the format limit")
+        return header_length
+
+    @staticmethod
+    def _shard_names(index: Optional[Dict[str, Any]]) -> List[str]:
+        """Get the shard files listed by an index, or the single weights file"""
+        if index is None:
+            return [SAFETENSORS_SINGLE_FILE]
+        return sorted(set(index["weight_map"].values()))
+
+    def _count_local(self, model_dir: Path) -> int:
+        """Count parameters from the shards of a local mirror"""
+        index_path = model_dir / SAFETENSORS_INDEX_FILE
+        index = json.loads(index_path.read_text()) if index_path.exists() else None
+
+        total = 0
+        for shard in self._shard_names(index):
+            shard_path = model_dir / shard
+            # Hub cache snapshots link each file to a blob named after its sha
+            resolved = shard_path.resolve()
+            blob_sha = resolved.name if resolved.parent.name == "blobs" else None
+            if blob_sha is not None and blob_sha in self._shard_counts:
+                total += self._shard_counts[blob_sha]
+                continue
+
+            with open(shard_path, "rb") as f:
+                header_length = self._header_length(f.read(HEADER_PREFIX_BYTES))
+                count = self._count_header(json.loads(f.read(header_length)))
+            if blob_sha is not None:
+                self._shard_counts[blob_sha] = count
+            total += count
+        return total
+
+    async def _count_remote(self, model_id: str, revision: str) -> Optional[int]:
+        """Count parameters from the shard headers of a hub repo"""
+        base_url = f"{self.endpoint}/{model_id}/resolve/{revision}"
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with aiohttp.ClientSession(headers=self.headers) as session:
+            async with session.get(f"{base_url}/{SAFETENSORS_INDEX_FILE}") as response:
+                if response.status == 404:
+                    index = None
+                elif response.status != 200:
+                    raise Exception(f"Failed to get {SAFETENSORS_INDEX_FILE}: HTTP {response.status}")
+                else:
+                    index = json.loads(await response.read())
+
+            async def count_shard(shard: str) -> int:
+                async with semaphore:
+                    return await self._count_remote_shard(session, f"{base_url}/{shard}")
+
+            counts = await asyncio.gather(*(count_shard(shard) for shard in self._shard_names(index)))
+
+        total = sum(counts)
+        logger.info(LogFormatter.info(f"Sized {model_id} from {len(counts)} safetensors headers: {total:,} parameters"))
+        return total
+
+    async def _count_remote_shard(self, session: aiohttp.ClientSession, url: str) -> int:
+        """Count the parameters of one remote shard, reading only its header"""
+        blob_sha = await self._get_blob_sha(session, url)
+        if blob_sha is not None and blob_sha in self._shard_counts:
+            return self._shard_counts[blob_sha]
+
+        # One request covers the prefix and most headers, a second one the rest if needed
+        data = await self._read_range(session, url, 0, HEADER_FIRST_READ)
+        header_length = self._header_length(data[:HEADER_PREFIX_BYTES])
+        header_end = HEADER_PREFIX_BYTES + header_length
+        if len(data) < header_end:
+            data += await self._read_range(session, url, len(data), header_end - len(data))
+
+        count = self._count_header(json.loads(data[HEADER_PREFIX_BYTES:header_end]))
+        if blob_sha is not None:
+            self._shard_counts[blob_sha] = count
+        return count
+
+    async def _get_blob_sha(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
+        """Get the blob sha of a file from the resolve endpoint's headers"""
+        async with session.head(url, allow_redirects=False) as response:
+            if response.status >= 400:
+                raise Exception(f"Failed to resolve {url}: HTTP {response.status}")
+            etag = response.headers.get("X-Linked-Etag") or response.headers.get("ETag")
+        return etag.strip('"').removeprefix("W/").strip('"') if etag else None
+
+    async def _read_range(self, session: aiohttp.ClientSession, url: str, start: int, length: int) -> bytes:
+        """Read up to length bytes of a file starting at start"""
+        headers = {"Range": f"bytes={start}-{start + length - 1}"}
+        async with session.get(url, headers=headers) as response:
+            if response.status == 416:
+                return b""
+            if response.status not in (200, 206):
+                raise Exception(f"Failed to read {url}: HTTP {response.status}")
+            if response.status == 200 and start:
+                raise Exception(f"Server ignored the range request for {url}")
+            # A server ignoring the range sends the whole file, of which only the start is read
+            data = await response.content.read(length)
+            while len(data) < length:
+                chunk = await response.content.read(length - len(data))
+                if not chunk:
+                    break
+                data += chunk
+            return data
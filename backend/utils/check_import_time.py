@@ -0,0 +1,80 @@
+import os
+import sys
+import logging
+import argparse
+import subprocess
+from pathlib import Path
+from typing import List, Tuple
+
+# Get the backend directory path
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Module whose import a worker pays at boot
+DEFAULT_MODULE = "app.asgi"
+DEFAULT_BUDGET_SECONDS = 3.0
+
+# Libraries that must only be imported on first use
+FORBIDDEN_MODULES = ("transformers", "datasets", "torch", "tensorflow", "pandas")
+
+def measure_imports(module: str) -> List[Tuple[str, int]]:
+    """Import a module in a fresh interpreter and return (module, cumulative microseconds) pairs"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(BACKEND_DIR), os.environ.get("PYTHONPATH")]))}
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    timings = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings.append((name.rstrip(), int(cumulative)))
+    return timings
+
+def main():
+    """Check that importing the API stays within its import-time budget"""
+    parser = argparse.ArgumentParser(description="Check the import time of the API")
+    parser.add_argument("--module", default=DEFAULT_MODULE, help="Module to import")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS, help="Maximum import time in seconds")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to show")
+    args = parser.parse_args()
+
+    timings = measure_imports(args.module)
+
+    # Nested imports are indented by two more spaces per level, so the top-level ones add up to the total
+    total = sum(cumulative for name, cumulative in timings if not name.startswith("  ")) / 1e6
+
+    logger.info(f"\n=== Import of {args.module}: {total:.2f}s (budget {args.budget:.2f}s) ===")
+    for name, cumulative in sorted(timings, key=lambda timing: timing[1], reverse=True)[:args.top]:
+        logger.info(f"{cumulative / 1e6:8.3f}s  {name.strip()}")
+
+    imported = {name.strip().split(".")[0] for name, _ in timings}
+    forbidden = sorted(imported.intersection(FORBIDDEN_MODULES))
+
+    failed = False
+    if forbidden:
+        logger.error(f"\n✗ Heavy libraries imported at startup: {', '.join(forbidden)}")
+        failed = True
+    if total > args.budget:
+        logger.error(f"\n✗ Import time {total:.2f}s exceeds the {args.budget:.2f}s budget")
+        failed = True
+
+    if failed:
+        sys.exit(1)
+    logger.info("\n✓ Import time within budget")
+
+if __name__ == "__main__":
+    main()
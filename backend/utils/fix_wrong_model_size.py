@@ -3,9 +3,11 @@ import json
 import pytz
 import logging
 import asyncio
+import argparse
 import sys  # 添加sys模块导入
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 import huggingface_hub
 from huggingface_hub.errors import RepositoryNotFoundError, RevisionNotFoundError
 from dotenv import load_dotenv
@@ -31,6 +33,10 @@ logger = logging.getLogger(__name__)
 
 validator = ModelValidator()
 
+# 并发的 Hub 请求数和每批写入的文件数
+DEFAULT_CONCURRENCY = 16
+DEFAULT_WRITE_BATCH_SIZE = 50
+
 # 首先定义辅助函数
 def read_json(repo_path, file):
     """读取JSON文件"""
@@ -44,70 +50,157 @@ def write_json(repo_path, file, content):
     with open(file_path, "w") as f:
         json.dump(content, f, indent=2)
 
+def write_json_batch(repo_path, updates):
+    """批量写入多个JSON文件"""
+    for file, content in updates:
+        write_json(repo_path, file, content)
+
 def get_files(repo_path):
     """获取目录中的所有 JSON 文件"""
     path = Path(repo_path)
     if not path.exists():
         return []
-    
+
     files = []
     for file_path in path.glob('**/*.json'):
         files.append(str(file_path.relative_to(repo_path)))
-    
-    return files
 
-# 然后定义主函数
-def main():
-    # 使用更可靠的路径构建方式
-    requests_path = Path(__file__).resolve().parent.parent.parent / "data" / "requests"
-    
-    # 确保目录存在
-    if not requests_path.exists():
-        os.makedirs(requests_path, exist_ok=True)
-        print(f"Created directory: {requests_path}")
-    
-    # 不再使用日期范围，直接获取所有文件
-    changed_files = get_files(requests_path)
+    return files
 
-    for file in tqdm(changed_files):
+def read_requests(repo_path, files):
+    """读取所有请求文件，跳过缺失的文件"""
+    requests = []
+    for file in files:
         try:
-            request_data = read_json(requests_path, file)
-        except FileNotFoundError as e:
+            requests.append((file, read_json(repo_path, file)))
+        except FileNotFoundError:
             tqdm.write(f"文件 {file} 未找到")
-            continue
-        
-        try:
-            model_info = API.model_info(
-                repo_id=request_data["model"],
-                revision=request_data["revision"],
+    return requests
+
+class SizingPipeline:
+    """在同一个事件循环中并发计算模型大小，相同的 Hub 请求只执行一次"""
+
+    def __init__(self, concurrency: int):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        # (model, revision) -> model_info 任务
+        self.model_infos: Dict[Tuple[str, str], asyncio.Task] = {}
+        # (model, revision, precision, base_model) -> (size, error) 任务
+        self.sizes: Dict[Tuple[str, str, str, Optional[str]], asyncio.Task] = {}
+
+    async def _fetch_model_info(self, model: str, revision: str) -> Any:
+        """获取模型信息，受并发数限制"""
+        async with self.semaphore:
+            return await asyncio.to_thread(
+                API.model_info,
+                repo_id=model,
+                revision=revision,
                 token=HF_TOKEN
             )
-        except (RepositoryNotFoundError, RevisionNotFoundError) as e:
-            tqdm.write(f"Model info for {request_data['model']} not found")
-            continue
-        
-        with logging_redirect_tqdm():
-            new_model_size, error = asyncio.run(validator.get_model_size(
+
+    def get_model_info(self, model: str, revision: str) -> asyncio.Task:
+        """共享的模型信息缓存"""
+        key = (model, revision)
+        if key not in self.model_infos:
+            self.model_infos[key] = asyncio.create_task(self._fetch_model_info(model, revision))
+        return self.model_infos[key]
+
+    async def _compute_size(self, model: str, revision: str, precision: str, base_model: Optional[str]) -> Tuple[Optional[float], Optional[str]]:
+        """计算模型大小，受并发数限制"""
+        model_info = await self.get_model_info(model, revision)
+        async with self.semaphore:
+            return await validator.get_model_size(
                 model_info=model_info,
-                precision=request_data["precision"],
-                base_model=request_data["base_model"],
-                revision=request_data["revision"]
-            ))
+                precision=precision,
+                base_model=base_model,
+                revision=revision
+            )
+
+    def get_model_size(self, model: str, revision: str, precision: str, base_model: Optional[str]) -> asyncio.Task:
+        """共享的模型大小缓存，同一模型配置只计算一次"""
+        key = (model, revision, precision, base_model)
+        if key not in self.sizes:
+            self.sizes[key] = asyncio.create_task(self._compute_size(*key))
+        return self.sizes[key]
+
+    async def check_request(self, file: str, request_data: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any], Any, float]]:
+        """检查一个请求文件，返回需要更新的 (文件, 新内容, 旧大小, 新大小)"""
+        try:
+            new_model_size, error = await self.get_model_size(
+                request_data["model"],
+                request_data["revision"],
+                request_data["precision"],
+                request_data["base_model"]
+            )
+        except (RepositoryNotFoundError, RevisionNotFoundError):
+            tqdm.write(f"Model info for {request_data['model']} not found")
+            return None
+        except Exception as e:
+            tqdm.write(f"Error getting model size info for {request_data['model']}, {e}")
+            return None
 
         if error:
             tqdm.write(f"Error getting model size info for {request_data['model']}, {error}")
-            continue
-        
+            return None
+
         old_model_size = request_data["params"]
-        if old_model_size != new_model_size:
-            if new_model_size > 100:
-                tqdm.write(f"Model: {request_data['model']}, size is more 100B: {new_model_size}")
-            
-            tqdm.write(f"Model: {request_data['model']}, old size: {request_data['params']} new size: {new_model_size}")
-            tqdm.write(f"Updating request file {file}")
-
-            request_data["params"] = new_model_size
-            write_json(requests_path, file, content=request_data)
+        if old_model_size == new_model_size:
+            return None
+
+        if new_model_size > 100:
+            tqdm.write(f"Model: {request_data['model']}, size is more 100B: {new_model_size}")
+        return file, {**request_data, "params": new_model_size}, old_model_size, new_model_size
+
+def print_report(changes):
+    """打印大小变更报告"""
+    print(f"\n{len(changes)} request files with a wrong model size:")
+    for file, request_data, old_model_size, new_model_size in sorted(changes, key=lambda change: change[0]):
+        print(f"  {file}")
+        print(f"    - params: {old_model_size}")
+        print(f"    + params: {new_model_size}")
+
+async def run(requests_path: Path, dry_run: bool, concurrency: int, batch_size: int):
+    """并发检查所有请求文件，然后批量写入变更"""
+    # 不再使用日期范围，直接获取所有文件
+    changed_files = await asyncio.to_thread(get_files, requests_path)
+    requests = await asyncio.to_thread(read_requests, requests_path, changed_files)
+
+    pipeline = SizingPipeline(concurrency)
+    tasks = [asyncio.create_task(pipeline.check_request(file, request_data)) for file, request_data in requests]
+
+    changes = []
+    with logging_redirect_tqdm():
+        for task in tqdm(asyncio.as_completed(tasks), total=len(tasks)):
+            change = await task
+            if change is not None:
+                changes.append(change)
+
+    print_report(changes)
+    if dry_run:
+        print("\nDry run, no files were written")
+        return
+
+    for start in range(0, len(changes), batch_size):
+        batch = [(file, request_data) for file, request_data, _, _ in changes[start:start + batch_size]]
+        await asyncio.to_thread(write_json_batch, requests_path, batch)
+    print(f"\nUpdated {len(changes)} request files")
+
+# 然后定义主函数
+def main():
+    parser = argparse.ArgumentParser(description="Recompute the model size of every request file")
+    parser.add_argument("--dry-run", action="store_true", help="Only report the size changes")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Concurrent hub requests")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_WRITE_BATCH_SIZE, help="Request files written per batch")
+    args = parser.parse_args()
+
+    # 使用更可靠的路径构建方式
+    requests_path = Path(__file__).resolve().parent.parent.parent / "data" / "requests"
+
+    # 确保目录存在
+    if not requests_path.exists():
+        os.makedirs(requests_path, exist_ok=True)
+        print(f"Created directory: {requests_path}")
+
+    asyncio.run(run(requests_path, args.dry_run, args.concurrency, args.batch_size))
 
 if __name__ == "__main__":
     main()
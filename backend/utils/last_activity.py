@@ -5,6 +5,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Tuple
 from huggingface_hub import HfApi
+from huggingface_hub.utils import EntryNotFoundError
 from dotenv import load_dotenv
 
 # Get the backend directory path
@@ -30,28 +31,54 @@ api = HfApi(token=HF_TOKEN)
 # Default organization
 HF_ORGANIZATION = os.getenv('HF_ORGANIZATION', 'open-llm-leaderboard')
 
+# Import project modules
+from app.config.hf_config import VOTES_BASE_FILE, VOTES_SHARDS_DIR
+
+def list_vote_files() -> List[str]:
+    """List the base votes file and the vote shards of the votes dataset"""
+    try:
+        shards = sorted(
+            entry.path
+            for entry in api.list_repo_tree(
+                repo_id=f"{HF_ORGANIZATION}/votes",
+                path_in_repo=VOTES_SHARDS_DIR,
+                recursive=True,
+                repo_type="dataset"
+            )
+            if entry.path.endswith(".jsonl")
+        )
+    except EntryNotFoundError:
+        shards = []
+    return [VOTES_BASE_FILE] + shards
+
 def get_last_votes(limit: int = 5) -> List[Dict]:
     """Get the last votes from the votes dataset"""
     try:
         logger.info("\nFetching last votes...")
         
-        # Download and read votes file
-        logger.info("Downloading votes file...")
-        votes_file = api.hf_hub_download(
-            repo_id=f"{HF_ORGANIZATION}/votes",
-            filename="votes_data.jsonl",
-            repo_type="dataset"
-        )
+        # Recent votes live in shards until they are compacted into the base file
+        vote_files = list_vote_files()
+        logger.info(f"Downloading {len(vote_files)} votes files...")
         
-        logger.info("Reading votes file...")
         votes = []
-        with open(votes_file, 'r') as f:
-            for line in f:
-                try:
-                    vote = json.loads(line)
-                    votes.append(vote)
-                except json.JSONDecodeError:
-                    continue
+        for filename in vote_files:
+            try:
+                votes_file = api.hf_hub_download(
+                    repo_id=f"{HF_ORGANIZATION}/votes",
+                    filename=filename,
+                    repo_type="dataset"
+                )
+            except EntryNotFoundError:
+                logger.info(f"{filename} not found, skipping")
+                continue
+            
+            with open(votes_file, 'r') as f:
+                for line in f:
+                    try:
+                        vote = json.loads(line)
+                        votes.append(vote)
+                    except json.JSONDecodeError:
+                        continue
         
         # Sort by timestamp and get last n votes
         logger.info("Sorting votes...")